@@ -6,65 +6,130 @@ for different deployment environments.
 """
 
 import os
-from typing import List, Optional
-from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+from functools import cached_property
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+# Available house systems
+HOUSE_SYSTEMS: Tuple[str, ...] = (
+    "placidus", "koch", "porphyrius", "regiomontanus", "campanus",
+    "equal", "whole_sign", "alcabitus", "krusinski", "morinus"
+)
+
+# Default astrological objects
+DEFAULT_PLANETS: Tuple[str, ...] = (
+    "sun", "moon", "mercury", "venus", "mars", "jupiter", 
+    "saturn", "uranus", "neptune", "pluto"
+)
+
+# Extended objects including asteroids and points
+EXTENDED_OBJECTS: Tuple[str, ...] = DEFAULT_PLANETS + (
+    "north_node", "south_node", "chiron", "lilith", "ceres",
+    "pallas", "juno", "vesta", "part_of_fortune", "vertex"
+)
+
+# Aspect types and default orbs
+ASPECT_ORBS: Mapping[str, float] = MappingProxyType({
+    "conjunction": 8.0,
+    "opposition": 8.0,
+    "trine": 8.0,
+    "square": 8.0,
+    "sextile": 6.0,
+    "quincunx": 3.0,
+    "semisextile": 3.0,
+    "semisquare": 2.0,
+    "sesquisquare": 2.0,
+    "quintile": 2.0,
+    "biquintile": 2.0
+})
+
+# MCP server capabilities
+MCP_CAPABILITIES: Mapping[str, Mapping[str, bool]] = MappingProxyType({
+    "experimental": MappingProxyType({}),
+    "logging": MappingProxyType({}),
+    "prompts": MappingProxyType({"listChanged": True}),
+    "resources": MappingProxyType({"subscribe": True}),
+    "tools": MappingProxyType({"listChanged": True})
+})
+
+# Names of the advertised MCP capabilities
+MCP_CAPABILITY_NAMES: Tuple[str, ...] = tuple(MCP_CAPABILITIES)
+
+# Supported chart types
+CHART_TYPES: Tuple[str, ...] = (
+    "natal",
+    "progressed",
+    "solar_return",
+    "composite",
+    "synastry",
+    "transits"
+)
 
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
     
     # Environment Configuration
-    environment: str = Field(default="development", env="ENVIRONMENT")
-    debug: bool = Field(default=True, env="DEBUG")
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
-    mcp_mode: bool = Field(default=False, env="MCP_MODE")
+    environment: str = Field(default="development")
+    debug: bool = Field(default=True)
+    log_level: str = Field(default="INFO")
+    mcp_mode: bool = Field(default=False)
     
     # Server Configuration  
-    host: str = Field(default="0.0.0.0", env="HOST")
-    port: int = Field(default=8000, env="PORT")
-    reload: bool = Field(default=True, env="RELOAD")
+    host: str = Field(default="0.0.0.0")
+    port: int = Field(default=8000)
+    reload: bool = Field(default=True)
     
     # MCP Configuration
-    mcp_server_name: str = Field(default="immanuel-astrology", env="MCP_SERVER_NAME")
-    mcp_server_version: str = Field(default="1.0.0", env="MCP_SERVER_VERSION")
-    mcp_protocol_version: str = Field(default="2024-11-05", env="MCP_PROTOCOL_VERSION")
+    mcp_server_name: str = Field(default="immanuel-astrology")
+    mcp_server_version: str = Field(default="1.0.0")
+    mcp_protocol_version: str = Field(default="2024-11-05")
+    jsonrpc_max_batch_size: int = Field(default=50)
     
     # Astrology Configuration
-    default_house_system: str = Field(default="placidus", env="DEFAULT_HOUSE_SYSTEM")
-    default_objects: str = Field(
-        default="sun,moon,mercury,venus,mars,jupiter,saturn,uranus,neptune,pluto",
-        env="DEFAULT_OBJECTS"
-    )
-    default_aspect_orb: float = Field(default=8.0, env="DEFAULT_ASPECT_ORB")
-    enable_asteroids: bool = Field(default=False, env="ENABLE_ASTEROIDS")
+    default_house_system: str = Field(default="placidus")
+    default_objects: str = Field(default=",".join(DEFAULT_PLANETS))
+    default_aspect_orb: float = Field(default=8.0)
+    enable_asteroids: bool = Field(default=False)
+    chart_workers: int = Field(default=4)  # 0 computes charts on the event loop
     
     # Rate Limiting
-    rate_limit_requests: int = Field(default=100, env="RATE_LIMIT_REQUESTS")
-    rate_limit_window: int = Field(default=60, env="RATE_LIMIT_WINDOW")
+    rate_limit_requests: int = Field(default=100)
+    rate_limit_window: int = Field(default=60)
     
     # CORS Configuration
     cors_origins: str = Field(
-        default="http://localhost:3000,http://127.0.0.1:3000",
-        env="CORS_ORIGINS"
+        default="http://localhost:3000,http://127.0.0.1:3000"
     )
-    cors_allow_credentials: bool = Field(default=True, env="CORS_ALLOW_CREDENTIALS")
+    cors_allow_credentials: bool = Field(default=True)
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    # Trusted Host Configuration (enforced outside development)
+    trusted_hosts: str = Field(default="localhost,127.0.0.1")
     
-    @property
-    def default_objects_list(self) -> List[str]:
-        """Get default objects as a list."""
-        return [obj.strip() for obj in self.default_objects.split(",")]
+    @cached_property
+    def default_objects_list(self) -> Tuple[str, ...]:
+        """Get default objects as a tuple (parsed once per instance)."""
+        return tuple(obj.strip() for obj in self.default_objects.split(","))
     
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Get CORS origins as a list."""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+    @cached_property
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        """Get CORS origins as a tuple (parsed once per instance)."""
+        return tuple(origin.strip() for origin in self.cors_origins.split(","))
+    
+    @cached_property
+    def trusted_hosts_list(self) -> Tuple[str, ...]:
+        """Get trusted hosts, including the bind host when it is a real name."""
+        hosts = [host.strip() for host in self.trusted_hosts.split(",")]
+        hosts.append(self.host)
+        # Wildcard bind addresses never appear in a Host header
+        return tuple(
+            host for host in dict.fromkeys(hosts) if host and host not in ("0.0.0.0", "::")
+        )
     
     @property
     def is_development(self) -> bool:
@@ -82,60 +147,10 @@ class Settings(BaseSettings):
         return self.mcp_mode
 
 
-@lru_cache()
-def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
-
-
-# Available house systems
-HOUSE_SYSTEMS = [
-    "placidus", "koch", "porphyrius", "regiomontanus", "campanus",
-    "equal", "whole_sign", "alcabitus", "krusinski", "morinus"
-]
-
-# Default astrological objects
-DEFAULT_PLANETS = [
-    "sun", "moon", "mercury", "venus", "mars", "jupiter", 
-    "saturn", "uranus", "neptune", "pluto"
-]
-
-# Extended objects including asteroids and points
-EXTENDED_OBJECTS = DEFAULT_PLANETS + [
-    "north_node", "south_node", "chiron", "lilith", "ceres",
-    "pallas", "juno", "vesta", "part_of_fortune", "vertex"
-]
-
-# Aspect types and default orbs
-ASPECT_ORBS = {
-    "conjunction": 8.0,
-    "opposition": 8.0,
-    "trine": 8.0,
-    "square": 8.0,
-    "sextile": 6.0,
-    "quincunx": 3.0,
-    "semisextile": 3.0,
-    "semisquare": 2.0,
-    "sesquisquare": 2.0,
-    "quintile": 2.0,
-    "biquintile": 2.0
-}
+# Settings singleton, created once on import
+SETTINGS = Settings()
 
-# MCP server capabilities
-MCP_CAPABILITIES = {
-    "experimental": {},
-    "logging": {},
-    "prompts": {"listChanged": True},
-    "resources": {"subscribe": True},
-    "tools": {"listChanged": True}
-}
 
-# Supported chart types
-CHART_TYPES = [
-    "natal",
-    "progressed",
-    "solar_return",
-    "composite",
-    "synastry",
-    "transits"
-]
\ No newline at end of file
+def get_settings() -> Settings:
+    """Get the shared settings instance."""
+    return SETTINGS
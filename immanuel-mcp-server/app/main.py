@@ -6,16 +6,16 @@ middleware, and error handling for the MCP server.
 """
 
 import time
-from datetime import datetime
 from typing import Any, Dict
 
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from pydantic import ValidationError as PydanticValidationError
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.config import get_settings, MCP_CAPABILITIES
+from app.config import SETTINGS as settings, CHART_TYPES, HOUSE_SYSTEMS, MCP_CAPABILITY_NAMES
 from app.models.requests import (
     HealthResponse, 
     ErrorResponse, 
@@ -25,12 +25,14 @@ from app.models.requests import (
 )
 from app.utils.logging import configure_logging, get_logger
 from app.utils.exceptions import ImmanuelMCPError
-from app.routes.mcp import router as mcp_router
+from app.utils.responses import ORJSONResponse
+from app.utils.timestamps import utcnow_iso
+from app.routes.mcp import router as mcp_router, chart_service
 from app.routes.health import router as health_router
 
-# Configure logging
-settings = get_settings()
-configure_logging(settings.log_level, settings.is_development)
+# Configure logging (MCP mode is configured by app.mcp_main before import)
+if not settings.is_mcp_mode:
+    configure_logging(settings.log_level, settings.is_development)
 logger = get_logger(__name__)
 
 # Create FastAPI application
@@ -41,12 +43,13 @@ app = FastAPI(
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
     openapi_url="/openapi.json" if settings.is_development else None,
+    default_response_class=ORJSONResponse,
 )
 
 # Add middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
+    allow_origins=list(settings.cors_origins_list),
     allow_credentials=settings.cors_allow_credentials,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
@@ -55,35 +58,53 @@ app.add_middleware(
 if not settings.is_development:
     app.add_middleware(
         TrustedHostMiddleware,
-        allowed_hosts=["localhost", "127.0.0.1", settings.host]
+        allowed_hosts=list(settings.trusted_hosts_list)
     )
 
 # Global variables for uptime tracking
-start_time = time.time()
+start_time = time.monotonic()
 
 
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next: Any) -> Any:
-    """Add request processing time to response headers."""
-    start_time_req = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time_req
-    response.headers["X-Process-Time"] = str(process_time)
+class ProcessTimeMiddleware:
+    """ASGI middleware adding request processing time to response headers."""
     
-    # Log request
-    logger.info(
-        "Request processed",
-        method=request.method,
-        url=str(request.url),
-        status_code=response.status_code,
-        process_time=process_time
-    )
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
     
-    return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time_req = time.perf_counter()
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", f"{time.perf_counter() - start_time_req:.6f}")
+            await send(message)
+        
+        await self.app(scope, receive, send_wrapper)
+        
+        # Logged in every environment; filter_by_level runs first, so
+        # LOG_LEVEL=WARNING drops this before any rendering work
+        logger.info(
+            "Request processed",
+            method=scope["method"],
+            path=scope["path"],
+            status_code=status_code,
+            process_time=time.perf_counter() - start_time_req
+        )
+
+
+app.add_middleware(ProcessTimeMiddleware)
 
 
 @app.exception_handler(ImmanuelMCPError)
-async def immanuel_mcp_error_handler(request: Request, exc: ImmanuelMCPError) -> JSONResponse:
+async def immanuel_mcp_error_handler(request: Request, exc: ImmanuelMCPError) -> ORJSONResponse:
     """Handle custom Immanuel MCP errors."""
     logger.error(
         "Immanuel MCP error",
@@ -93,47 +114,49 @@ async def immanuel_mcp_error_handler(request: Request, exc: ImmanuelMCPError) ->
         path=request.url.path
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.error_code,
-        content=ErrorResponse(
+        content=ErrorResponse.model_construct(
             error=exc.__class__.__name__,
             message=exc.message,
             details=exc.details,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=utcnow_iso()
         ).model_dump()
     )
 
 
 @app.exception_handler(PydanticValidationError)
-async def validation_error_handler(request: Request, exc: PydanticValidationError) -> JSONResponse:
+async def validation_error_handler(request: Request, exc: PydanticValidationError) -> ORJSONResponse:
     """Handle Pydantic validation errors."""
+    # Collect errors once; user input is left out of both response and logs.
+    # Error payloads are server-built, so they are constructed without validation
+    errors = exc.errors(include_url=False, include_input=False)
     details = [
-        ValidationErrorDetail(
-            field=".".join(str(x) for x in error["loc"]),
+        ValidationErrorDetail.model_construct(
+            field=".".join(map(str, error["loc"])),
             message=error["msg"],
-            type=error["type"],
-            input=error.get("input")
+            type=error["type"]
         )
-        for error in exc.errors()
+        for error in errors
     ]
     
     logger.warning(
         "Validation error",
         path=request.url.path,
-        errors=exc.errors()
+        errors=errors
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
-        content=ValidationErrorResponse(
+        content=ValidationErrorResponse.model_construct(
             details=details,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=utcnow_iso()
         ).model_dump()
     )
 
 
 @app.exception_handler(HTTPException)
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """Handle HTTP exceptions."""
     logger.warning(
         "HTTP exception",
@@ -142,18 +165,18 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         path=request.url.path
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=ErrorResponse(
+        content=ErrorResponse.model_construct(
             error="HTTPException",
             message=exc.detail,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=utcnow_iso()
         ).model_dump()
     )
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle unexpected exceptions."""
     logger.error(
         "Unexpected error",
@@ -163,31 +186,34 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         exc_info=True
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
-        content=ErrorResponse(
+        content=ErrorResponse.model_construct(
             error="InternalServerError",
             message="An unexpected error occurred" if not settings.is_development else str(exc),
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=utcnow_iso()
         ).model_dump()
     )
 
 
+# Server information is derived from settings and constants only, so it is
+# built once at import instead of on every request
+ROOT_PAYLOAD: Dict[str, Any] = ServerInfoResponse(
+    name=settings.mcp_server_name,
+    version=settings.mcp_server_version,
+    protocol_version=settings.mcp_protocol_version,
+    description="Model Context Protocol server for the Immanuel astrology library",
+    capabilities=list(MCP_CAPABILITY_NAMES),
+    supported_chart_types=list(CHART_TYPES),
+    supported_house_systems=list(HOUSE_SYSTEMS),
+    supported_objects=list(settings.default_objects_list)
+).model_dump()
+
+
 @app.get("/")
 async def root() -> Dict[str, Any]:
     """Root endpoint with server information."""
-    uptime = time.time() - start_time
-    
-    return ServerInfoResponse(
-        name=settings.mcp_server_name,
-        version=settings.mcp_server_version,
-        protocol_version=settings.mcp_protocol_version,
-        description="Model Context Protocol server for the Immanuel astrology library",
-        capabilities=list(MCP_CAPABILITIES.keys()),
-        supported_chart_types=["natal", "progressed", "solar_return", "composite", "synastry", "transits"],
-        supported_house_systems=["placidus", "koch", "porphyrius", "regiomontanus", "campanus", "equal", "whole_sign"],
-        supported_objects=settings.default_objects_list
-    ).model_dump()
+    return ROOT_PAYLOAD
 
 
 # Include routers
@@ -211,6 +237,7 @@ async def startup_event() -> None:
 async def shutdown_event() -> None:
     """Application shutdown event."""
     logger.info("Shutting down Immanuel MCP Server")
+    chart_service.shutdown()
 
 
 if __name__ == "__main__":
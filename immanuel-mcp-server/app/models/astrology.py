@@ -5,37 +5,68 @@ This module defines Pydantic models for astrological data structures,
 including charts, aspects, planets, houses, and interpretations.
 """
 
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Self, Tuple, Union
 from decimal import Decimal
 
-from pydantic import BaseModel, Field, ConfigDict, validator
+from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 
+from app.utils.timestamps import utcnow
 
-class GeographicCoordinate(BaseModel):
+# DMS coordinate format, e.g. "32n43" or "117w09"
+_DMS_RE = re.compile(r"^\d+(?:\.\d+)?[nsewNSEW](?:\d+(?:\.\d+)?)?$")
+
+# Accepted range for coordinates given in decimal degrees
+_MIN_DECIMAL_COORDINATE = -180.0
+_MAX_DECIMAL_COORDINATE = 180.0
+
+
+@lru_cache(maxsize=1024)
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO format datetime, memoizing repeated values."""
+    # fromisoformat accepts a trailing "Z" natively on Python 3.11+
+    return datetime.fromisoformat(value)
+
+
+def _validate_iso_datetime(value: str) -> str:
+    """Ensure a string is an ISO format datetime."""
+    try:
+        parse_iso_datetime(value)
+    except ValueError:
+        raise ValueError(f"Invalid datetime format: {value}")
+    return value
+
+
+class BaseAstroModel(BaseModel):
+    """Immutable base for request and chart models built on every request."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
+class GeographicCoordinate(BaseAstroModel):
     """Geographic coordinate representation."""
-    model_config = ConfigDict(extra="forbid")
     
     latitude: Union[str, float] = Field(..., description="Latitude in decimal degrees or DMS format")
     longitude: Union[str, float] = Field(..., description="Longitude in decimal degrees or DMS format")
     
-    @validator('latitude', 'longitude', pre=True)
+    @field_validator('latitude', 'longitude', mode='before')
+    @classmethod
     def validate_coordinates(cls, v: Union[str, float]) -> Union[str, float]:
         """Validate coordinate formats."""
         if isinstance(v, str):
             # Validate DMS format (e.g., "32n43" or "117w09")
-            if not (v[-1].lower() in 'nsew' and v[:-1].replace('.', '').isdigit()):
+            if _DMS_RE.match(v) is None:
                 raise ValueError(f"Invalid coordinate format: {v}")
         elif isinstance(v, (int, float)):
             # Validate decimal degrees
-            if not -180 <= v <= 180:
+            if not _MIN_DECIMAL_COORDINATE <= v <= _MAX_DECIMAL_COORDINATE:
                 raise ValueError(f"Coordinate out of range: {v}")
         return v
 
 
-class ChartRequest(BaseModel):
+class ChartRequest(BaseAstroModel):
     """Base chart generation request."""
-    model_config = ConfigDict(extra="forbid")
     
     date_time: str = Field(..., description="ISO format datetime: YYYY-MM-DD HH:MM:SS")
     coordinates: GeographicCoordinate
@@ -43,14 +74,20 @@ class ChartRequest(BaseModel):
     house_system: Optional[str] = Field("placidus", description="House system to use")
     objects: Optional[List[str]] = Field(None, description="List of objects to include")
     
-    @validator('date_time')
+    @model_validator(mode='before')
+    @classmethod
+    def nest_coordinates(cls, data: Any) -> Any:
+        """Accept the tool schemas' top-level latitude and longitude."""
+        if isinstance(data, dict) and "coordinates" not in data and "latitude" in data and "longitude" in data:
+            data = dict(data)
+            data["coordinates"] = {"latitude": data.pop("latitude"), "longitude": data.pop("longitude")}
+        return data
+    
+    @field_validator('date_time')
+    @classmethod
     def validate_datetime(cls, v: str) -> str:
         """Validate datetime format."""
-        try:
-            datetime.fromisoformat(v.replace('Z', '+00:00'))
-        except ValueError:
-            raise ValueError(f"Invalid datetime format: {v}")
-        return v
+        return _validate_iso_datetime(v)
 
 
 class NatalChartRequest(ChartRequest):
@@ -62,6 +99,12 @@ class ProgressedChartRequest(ChartRequest):
     """Progressed chart generation request."""
     natal_chart: Dict[str, Any] = Field(..., description="Reference natal chart data")
     progression_date: str = Field(..., description="Date for progression")
+    
+    @field_validator('progression_date')
+    @classmethod
+    def validate_progression_date(cls, v: str) -> str:
+        """Validate progression date format."""
+        return _validate_iso_datetime(v)
 
 
 class SolarReturnRequest(ChartRequest):
@@ -71,36 +114,38 @@ class SolarReturnRequest(ChartRequest):
     return_location: Optional[GeographicCoordinate] = Field(None, description="Location for solar return")
 
 
-class CompositeChartRequest(BaseModel):
+class CompositeChartRequest(BaseAstroModel):
     """Composite chart generation request."""
-    model_config = ConfigDict(extra="forbid")
     
     person1: ChartRequest
     person2: ChartRequest
     house_system: Optional[str] = Field("placidus", description="House system to use")
 
 
-class SynastryRequest(BaseModel):
+class SynastryRequest(BaseAstroModel):
     """Synastry analysis request."""
-    model_config = ConfigDict(extra="forbid")
     
     person1: ChartRequest
     person2: ChartRequest
     aspect_orbs: Optional[Dict[str, float]] = Field(None, description="Custom aspect orbs")
 
 
-class TransitsRequest(BaseModel):
+class TransitsRequest(BaseAstroModel):
     """Transit analysis request."""
-    model_config = ConfigDict(extra="forbid")
     
     natal_chart: Dict[str, Any] = Field(..., description="Reference natal chart")
     transit_date: str = Field(..., description="Date for transit analysis")
     objects: Optional[List[str]] = Field(None, description="Transiting objects to include")
+    
+    @field_validator('transit_date')
+    @classmethod
+    def validate_transit_date(cls, v: str) -> str:
+        """Validate transit date format."""
+        return _validate_iso_datetime(v)
 
 
-class PlanetPosition(BaseModel):
+class PlanetPosition(BaseAstroModel):
     """Planet position data."""
-    model_config = ConfigDict(extra="forbid")
     
     name: str
     longitude: float
@@ -112,9 +157,8 @@ class PlanetPosition(BaseModel):
     dignities: Optional[Dict[str, Any]] = None
 
 
-class House(BaseModel):
+class House(BaseAstroModel):
     """House data."""
-    model_config = ConfigDict(extra="forbid")
     
     number: int
     cusp: float
@@ -122,9 +166,8 @@ class House(BaseModel):
     ruler: Optional[str] = None
 
 
-class Aspect(BaseModel):
+class Aspect(BaseAstroModel):
     """Aspect between two points."""
-    model_config = ConfigDict(extra="forbid")
     
     planet1: str
     planet2: str
@@ -136,9 +179,27 @@ class Aspect(BaseModel):
     interpretation: Optional[str] = None
 
 
-class ChartData(BaseModel):
+class PlanetColumns(NamedTuple):
+    """Column-wise view of chart planets for per-pair calculations."""
+    
+    names: Tuple[str, ...]
+    longitudes: Tuple[float, ...]
+    speeds: Tuple[float, ...]
+    signs: Tuple[str, ...]
+    
+    @classmethod
+    def from_planets(cls, planets: List[PlanetPosition]) -> "PlanetColumns":
+        """Split planet positions into parallel columns."""
+        return cls(
+            names=tuple(planet.name for planet in planets),
+            longitudes=tuple(planet.longitude for planet in planets),
+            speeds=tuple(planet.speed for planet in planets),
+            signs=tuple(planet.sign for planet in planets)
+        )
+
+
+class ChartData(BaseAstroModel):
     """Complete chart data structure."""
-    model_config = ConfigDict(extra="forbid")
     
     chart_type: str
     date_time: str
@@ -149,6 +210,33 @@ class ChartData(BaseModel):
     houses: List[House]
     aspects: List[Aspect]
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    
+    # Derived views are cached in the instance __dict__, which pydantic leaves
+    # out of equality and serialization; model_copy drops them so a copy made
+    # with new planets or aspects rebuilds its own
+    
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> Self:
+        """Copy the chart without its cached derived views."""
+        copied = super().model_copy(update=update, deep=deep)
+        for view in _CHART_DERIVED_VIEWS:
+            copied.__dict__.pop(view, None)
+        return copied
+    
+    @cached_property
+    def planet_columns(self) -> PlanetColumns:
+        """Planet data as parallel columns."""
+        return PlanetColumns.from_planets(self.planets)
+    
+    @cached_property
+    def aspects_by_type(self) -> Dict[str, List[Aspect]]:
+        """Chart aspects grouped by aspect type, in chart order."""
+        grouped: Dict[str, List[Aspect]] = {}
+        for aspect in self.aspects:
+            grouped.setdefault(aspect.aspect_type, []).append(aspect)
+        return grouped
+
+
+_CHART_DERIVED_VIEWS = ("planet_columns", "aspects_by_type")
 
 
 class ProgressedChart(ChartData):
@@ -220,7 +308,7 @@ class Interpretation(BaseModel):
     detailed_analysis: List[str]
     keywords: List[str]
     recommendations: Optional[List[str]] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
 
 
 class HouseMeaning(BaseModel):
@@ -38,7 +38,9 @@ class MCPError(BaseModel):
 
 class ServerCapabilities(BaseModel):
     """Server capabilities for MCP initialization."""
-    model_config = ConfigDict(extra="forbid")
+    # Frozen, like the tool/resource/prompt definitions, because MCPService
+    # shares single instances across requests
+    model_config = ConfigDict(extra="forbid", frozen=True)
     
     experimental: Optional[Dict[str, Any]] = None
     logging: Optional[Dict[str, Any]] = None
@@ -89,7 +91,7 @@ class ToolParameter(BaseModel):
 
 class Tool(BaseModel):
     """MCP tool definition."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     
     name: str
     description: str
@@ -136,7 +138,7 @@ class ToolCallResponse(BaseModel):
 
 class Resource(BaseModel):
     """MCP resource definition."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     
     uri: str
     name: str
@@ -185,7 +187,7 @@ class ResourceReadResponse(BaseModel):
 
 class PromptArgument(BaseModel):
     """Prompt argument definition."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     
     name: str
     description: str
@@ -194,7 +196,7 @@ class PromptArgument(BaseModel):
 
 class Prompt(BaseModel):
     """MCP prompt definition."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     
     name: str
     description: str
@@ -218,7 +220,7 @@ class PromptsListResponse(BaseModel):
 
 class PromptMessage(BaseModel):
     """Message in prompt response."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     
     role: str
     content: Dict[str, Any]
@@ -2,18 +2,19 @@
 Request and response models for API endpoints.
 
 This module defines Pydantic models for HTTP request/response handling,
-validation, and serialization.
+validation, and serialization. Response models are only ever built by
+the server, so they ignore unknown fields instead of rejecting them.
 """
 
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, ConfigDict
+from typing_extensions import TypedDict
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(TypedDict):
     """Health check response."""
-    model_config = ConfigDict(extra="forbid")
     
-    status: str = "healthy"
+    status: str
     timestamp: str
     version: str
     uptime: float
@@ -21,7 +22,7 @@ class HealthResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Standard error response."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="ignore")
     
     error: str
     message: str
@@ -31,17 +32,17 @@ class ErrorResponse(BaseModel):
 
 class ValidationErrorDetail(BaseModel):
     """Validation error detail."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="ignore")
     
     field: str
     message: str
     type: str
-    input: Any
+    input: Any = None
 
 
 class ValidationErrorResponse(BaseModel):
     """Validation error response."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="ignore")
     
     error: str = "validation_error"
     message: str = "Request validation failed"
@@ -51,7 +52,7 @@ class ValidationErrorResponse(BaseModel):
 
 class APIResponse(BaseModel):
     """Generic API response wrapper."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="ignore")
     
     success: bool = True
     data: Optional[Any] = None
@@ -62,7 +63,7 @@ class APIResponse(BaseModel):
 
 class ServerInfoResponse(BaseModel):
     """Server information response."""
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="ignore")
     
     name: str
     version: str
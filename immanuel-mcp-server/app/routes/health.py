@@ -6,88 +6,78 @@ and load balancer integration.
 """
 
 import time
-from datetime import datetime
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 
 from app.config import get_settings, Settings
 from app.models.requests import HealthResponse
+from app.services.chart_service import import_immanuel
 from app.utils.logging import get_logger
+from app.utils.timestamps import utcnow_iso
 
 logger = get_logger(__name__)
 router = APIRouter()
 
 # Track server start time for uptime calculation
-start_time = time.time()
+start_time = time.monotonic()
+
+_HEALTH_ADAPTER = TypeAdapter(HealthResponse)
+
+
+def _health_response(status: str, settings: Settings) -> Response:
+    """Render a health payload straight to JSON bytes."""
+    payload: HealthResponse = {
+        "status": status,
+        "timestamp": utcnow_iso(),
+        "version": settings.mcp_server_version,
+        "uptime": time.monotonic() - start_time
+    }
+    return Response(content=_HEALTH_ADAPTER.dump_json(payload), media_type="application/json")
 
 
 @router.get("/", response_model=HealthResponse)
-async def health_check(settings: Settings = Depends(get_settings)) -> HealthResponse:
+async def health_check(settings: Settings = Depends(get_settings)) -> Response:
     """
     Basic health check endpoint.
     
     Returns server status and basic information.
     """
-    uptime = time.time() - start_time
-    
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.utcnow().isoformat(),
-        version=settings.mcp_server_version,
-        uptime=uptime
-    )
+    return _health_response("healthy", settings)
 
 
 @router.get("/ready", response_model=HealthResponse)
-async def readiness_check(settings: Settings = Depends(get_settings)) -> HealthResponse:
+async def readiness_check(settings: Settings = Depends(get_settings)) -> Response:
     """
     Readiness check endpoint.
     
     Performs deeper checks to ensure the server is ready to serve requests.
     This could include checking dependencies, database connections, etc.
     """
-    uptime = time.time() - start_time
-    
     # In a real implementation, you might check:
     # - Database connectivity
     # - External service availability
     # - Required environment variables
     # - File system permissions
     
+    # Basic check - the same probe ChartService requires at startup
     try:
-        # Basic check - ensure we can import immanuel
-        import immanuel
-        logger.debug("Immanuel library check passed", version=getattr(immanuel, '__version__', 'unknown'))
-        
-        return HealthResponse(
-            status="ready",
-            timestamp=datetime.utcnow().isoformat(),
-            version=settings.mcp_server_version,
-            uptime=uptime
-        )
+        immanuel = import_immanuel()
     except ImportError as e:
         logger.error("Readiness check failed", error=str(e))
-        return HealthResponse(
-            status="not_ready",
-            timestamp=datetime.utcnow().isoformat(),
-            version=settings.mcp_server_version,
-            uptime=uptime
-        )
+        return _health_response("not_ready", settings)
+    
+    logger.debug("Immanuel library check passed", version=immanuel.version)
+    return _health_response("ready", settings)
 
 
 @router.get("/liveness", response_model=HealthResponse)
-async def liveness_check(settings: Settings = Depends(get_settings)) -> HealthResponse:
+async def liveness_check(settings: Settings = Depends(get_settings)) -> Response:
     """
     Liveness check endpoint.
     
     Simple check to verify the server process is running.
     Used by orchestrators to determine if the container should be restarted.
     """
-    uptime = time.time() - start_time
-    
-    return HealthResponse(
-        status="alive",
-        timestamp=datetime.utcnow().isoformat(),
-        version=settings.mcp_server_version,
-        uptime=uptime
-    )
\ No newline at end of file
+    return _health_response("alive", settings)
\ No newline at end of file
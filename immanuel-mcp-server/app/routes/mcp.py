@@ -5,13 +5,17 @@ This module implements all MCP endpoints including initialization,
 tools, resources, and prompts.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Union
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter, ValidationError as PydanticValidationError
 
-from app.config import get_settings, Settings
+from app.config import get_settings
 from app.models.mcp import (
     InitializeRequest,
     InitializeResponse,
@@ -31,7 +35,6 @@ from app.models.mcp import (
     PromptGetResponse,
     JSONRPCRequest,
     JSONRPCResponse,
-    MCPError,
     MCPProtocolVersion
 )
 from app.models.astrology import (
@@ -40,12 +43,17 @@ from app.models.astrology import (
     SolarReturnRequest,
     CompositeChartRequest,
     SynastryRequest,
-    TransitsRequest
+    TransitsRequest,
+    Aspect,
+    DignityScore,
+    ChartData
 )
-from app.services.mcp_service import MCPService
+from app.services.mcp_service import get_mcp_service
 from app.services.chart_service import ChartService
 from app.services.validation import ValidationService
 from app.utils.logging import get_logger
+from app.utils.responses import ORJSONResponse, PydanticResponse, serialize_model
+from app.utils.sanitize import sanitize_input
 from app.utils.exceptions import (
     ImmanuelMCPError,
     ToolNotFoundError,
@@ -56,20 +64,75 @@ from app.utils.exceptions import (
 )
 
 logger = get_logger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Service instances
-mcp_service = MCPService()
+mcp_service = get_mcp_service()
 chart_service = ChartService()
 validation_service = ValidationService()
 
+# Tool, resource and prompt lists are static for a server build, so their
+# responses are built and serialized once at import
+TOOLS_LIST_PAYLOAD: Dict[str, Any] = ToolsListResponse(
+    tools=list(mcp_service.list_tools()), nextCursor=None
+).model_dump(mode="json")
+RESOURCES_LIST_PAYLOAD: Dict[str, Any] = ResourcesListResponse(
+    resources=list(mcp_service.list_resources()), nextCursor=None
+).model_dump(mode="json")
+PROMPTS_LIST_PAYLOAD: Dict[str, Any] = PromptsListResponse(
+    prompts=list(mcp_service.list_prompts()), nextCursor=None
+).model_dump(mode="json")
+
+_TOOLS_LIST_BYTES = orjson.dumps(TOOLS_LIST_PAYLOAD)
+_RESOURCES_LIST_BYTES = orjson.dumps(RESOURCES_LIST_PAYLOAD)
+_PROMPTS_LIST_BYTES = orjson.dumps(PROMPTS_LIST_PAYLOAD)
+
+# Resource content is static too, so each resources/read reply is built and
+# serialized once per URI
+_RESOURCE_READ_BYTES: Mapping[str, bytes] = MappingProxyType({
+    resource.uri: serialize_model(ResourceReadResponse(contents=[ResourceContent(
+        uri=resource.uri,
+        mimeType="application/json",
+        text=mcp_service.get_resource_bytes(resource.uri).decode()
+    )]))
+    for resource in mcp_service.list_resources()
+})
+
+# The initialize reply depends only on settings and capabilities, so it is
+# serialized once as well
+_INITIALIZE_BYTES = InitializeResponse(
+    protocolVersion=MCPProtocolVersion.V1,
+    capabilities=mcp_service.get_server_capabilities(),
+    serverInfo={
+        "name": get_settings().mcp_server_name,
+        "version": get_settings().mcp_server_version
+    },
+    instructions="Welcome to the Immanuel MCP Server! Use the available tools to generate astrological charts and calculations."
+).model_dump_json().encode()
+
+_ASPECT_LIST_ADAPTER = TypeAdapter(List[Aspect])
+_DIGNITY_LIST_ADAPTER = TypeAdapter(List[DignityScore])
+
+# Tool argument validators, bound once instead of per call
+_NATAL_REQUEST_ADAPTER = TypeAdapter(NatalChartRequest)
+_PROGRESSED_REQUEST_ADAPTER = TypeAdapter(ProgressedChartRequest)
+_SOLAR_RETURN_REQUEST_ADAPTER = TypeAdapter(SolarReturnRequest)
+_COMPOSITE_REQUEST_ADAPTER = TypeAdapter(CompositeChartRequest)
+_SYNASTRY_REQUEST_ADAPTER = TypeAdapter(SynastryRequest)
+_TRANSITS_REQUEST_ADAPTER = TypeAdapter(TransitsRequest)
+_CHART_DATA_ADAPTER = TypeAdapter(ChartData)
+
+# Transits streamed per chunk of the get_transits HTTP response
+_TRANSIT_STREAM_CHUNK = 256
 
 @router.post("/initialize", response_model=InitializeResponse)
-async def initialize_mcp(
-    request: InitializeRequest,
-    settings: Settings = Depends(get_settings)
-) -> InitializeResponse:
+async def initialize_mcp(request: InitializeRequest) -> Response:
     """Initialize MCP connection and return server capabilities."""
+    return Response(content=_initialize(request), media_type="application/json")
+
+
+def _initialize(request: InitializeRequest) -> bytes:
+    """Check the client handshake and return the prebuilt initialize response."""
     logger.info("MCP initialization requested", client_info=request.clientInfo)
     
     try:
@@ -77,24 +140,8 @@ async def initialize_mcp(
         if request.protocolVersion != MCPProtocolVersion.V1:
             raise MCPProtocolError(f"Unsupported protocol version: {request.protocolVersion}")
         
-        # Get server capabilities
-        capabilities = mcp_service.get_server_capabilities()
-        
-        # Build server info
-        server_info = {
-            "name": settings.mcp_server_name,
-            "version": settings.mcp_server_version
-        }
-        
-        response = InitializeResponse(
-            protocolVersion=MCPProtocolVersion.V1,
-            capabilities=capabilities,
-            serverInfo=server_info,
-            instructions="Welcome to the Immanuel MCP Server! Use the available tools to generate astrological charts and calculations."
-        )
-        
         logger.info("MCP initialization completed successfully")
-        return response
+        return _INITIALIZE_BYTES
         
     except Exception as e:
         logger.error("MCP initialization failed", error=str(e), exc_info=True)
@@ -102,157 +149,151 @@ async def initialize_mcp(
 
 
 @router.post("/tools/list", response_model=ToolsListResponse)
-async def list_tools(request: ToolsListRequest = ToolsListRequest()) -> ToolsListResponse:
+async def list_tools(request: ToolsListRequest = ToolsListRequest()) -> Response:
     """List all available astrological tools."""
     logger.info("Tools list requested", cursor=request.cursor)
-    
-    try:
-        tools = mcp_service.list_tools(request.cursor)
-        
-        response = ToolsListResponse(
-            tools=tools,
-            nextCursor=None  # No pagination for now
-        )
-        
-        logger.info("Tools list provided", count=len(tools))
-        return response
-        
-    except Exception as e:
-        logger.error("Failed to list tools", error=str(e), exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Failed to list tools: {str(e)}")
+    logger.info("Tools list provided", count=len(TOOLS_LIST_PAYLOAD["tools"]))
+    return Response(content=_TOOLS_LIST_BYTES, media_type="application/json")
 
 
 @router.post("/tools/call", response_model=ToolCallResponse)
-async def call_tool(request: ToolCallRequest) -> ToolCallResponse:
+async def call_tool(request: ToolCallRequest) -> Response:
     """Execute an astrological tool."""
+    if request.name == "get_transits":
+        return await _stream_transits(request)
+    
+    response = await _call_tool(request)
+    return await PydanticResponse.create(response)
+
+
+async def _call_tool(request: ToolCallRequest) -> ToolCallResponse:
+    """Run a tool call and wrap the outcome in a tool result."""
     logger.info("Tool call requested", tool_name=request.name, arguments_keys=list(request.arguments.keys()))
     
     try:
-        # Validate tool exists
-        tool = mcp_service.get_tool(request.name)
-        
-        # Sanitize and validate arguments
-        sanitized_args = validation_service.sanitize_input(request.arguments)
-        validation_service.validate_mcp_tool_arguments(request.name, sanitized_args)
+        arguments = _checked_arguments(request)
         
         # Execute tool
-        result_data = await execute_tool(request.name, sanitized_args)
+        result_data = await execute_tool(request.name, arguments)
         
         # Create tool result
-        tool_result = ToolResult(
+        tool_result = ToolResult.model_construct(
             content=[{
                 "type": "text",
                 "text": f"Tool '{request.name}' executed successfully",
-                "data": result_data
+                "data": orjson.Fragment(result_data)
             }],
             isError=False
         )
         
-        response = ToolCallResponse(result=tool_result)
+        response = ToolCallResponse.model_construct(result=tool_result)
         
         logger.info("Tool executed successfully", tool_name=request.name)
         return response
         
-    except (ToolNotFoundError, ValidationError) as e:
-        logger.warning("Tool call validation failed", tool_name=request.name, error=str(e))
-        tool_result = ToolResult(
-            content=[{
-                "type": "text",
-                "text": f"Tool execution failed: {str(e)}"
-            }],
-            isError=True
-        )
-        return ToolCallResponse(result=tool_result)
-        
     except Exception as e:
-        logger.error("Tool execution failed", tool_name=request.name, error=str(e), exc_info=True)
-        tool_result = ToolResult(
-            content=[{
-                "type": "text",
-                "text": f"Tool execution failed: {str(e)}"
-            }],
-            isError=True
-        )
-        return ToolCallResponse(result=tool_result)
+        return _tool_failure(request, e)
 
 
-@router.post("/resources/list", response_model=ResourcesListResponse)
-async def list_resources(request: ResourcesListRequest = ResourcesListRequest()) -> ResourcesListResponse:
-    """List all available astrological resources."""
-    logger.info("Resources list requested", cursor=request.cursor)
+def _checked_arguments(request: ToolCallRequest) -> Dict[str, Any]:
+    """Check the tool exists and return its arguments sanitized and validated."""
+    mcp_service.get_tool(request.name)
+    
+    # Sanitize once, then check tool-specific rules on the cleaned values
+    arguments: Dict[str, Any] = sanitize_input(request.arguments)
+    validation_service.validate_mcp_tool_arguments(request.name, arguments)
+    return arguments
+
+
+def _tool_failure(request: ToolCallRequest, error: Exception) -> ToolCallResponse:
+    """Log a failed tool call and wrap the error in a tool result."""
+    if isinstance(error, (ToolNotFoundError, ValidationError)):
+        logger.warning("Tool call validation failed", tool_name=request.name, error=str(error))
+    else:
+        logger.error("Tool execution failed", tool_name=request.name, error=str(error), exc_info=True)
+    
+    tool_result = ToolResult.model_construct(
+        content=[{
+            "type": "text",
+            "text": f"Tool execution failed: {str(error)}"
+        }],
+        isError=True
+    )
+    return ToolCallResponse.model_construct(result=tool_result)
+
+
+async def _stream_transits(request: ToolCallRequest) -> Response:
+    """Run get_transits and stream the transit rows instead of buffering them."""
+    logger.info("Tool call requested", tool_name=request.name, arguments_keys=list(request.arguments.keys()))
     
     try:
-        resources = mcp_service.list_resources(request.cursor)
-        
-        response = ResourcesListResponse(
-            resources=resources,
-            nextCursor=None  # No pagination for now
-        )
-        
-        logger.info("Resources list provided", count=len(resources))
-        return response
-        
+        arguments = _checked_arguments(request)
+        transits_request = _TRANSITS_REQUEST_ADAPTER.validate_python(arguments)
+        transits = await chart_service.get_transits(transits_request)
     except Exception as e:
-        logger.error("Failed to list resources", error=str(e), exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Failed to list resources: {str(e)}")
+        return await PydanticResponse.create(_tool_failure(request, e))
+    
+    logger.info("Tool executed successfully", tool_name=request.name)
+    return StreamingResponse(_transit_chunks(request.name, transits), media_type="application/json")
+
+
+async def _transit_chunks(tool_name: str, transits: List[Aspect]) -> AsyncIterator[bytes]:
+    """Yield a tool call response body with transits serialized in slices."""
+    text = orjson.dumps(f"Tool '{tool_name}' executed successfully")
+    yield b'{"result":{"content":[{"type":"text","text":' + text + b',"data":{"transits":['
+    
+    for start in range(0, len(transits), _TRANSIT_STREAM_CHUNK):
+        # Each slice is dumped as an array and spliced in without its brackets
+        rows = _ASPECT_LIST_ADAPTER.dump_json(transits[start:start + _TRANSIT_STREAM_CHUNK])[1:-1]
+        yield rows if start == 0 else b"," + rows
+    
+    yield b']}}],"isError":false}}'
+
+
+@router.post("/resources/list", response_model=ResourcesListResponse)
+async def list_resources(request: ResourcesListRequest = ResourcesListRequest()) -> Response:
+    """List all available astrological resources."""
+    logger.info("Resources list requested", cursor=request.cursor)
+    logger.info("Resources list provided", count=len(RESOURCES_LIST_PAYLOAD["resources"]))
+    return Response(content=_RESOURCES_LIST_BYTES, media_type="application/json")
 
 
 @router.post("/resources/read", response_model=ResourceReadResponse)
-async def read_resource(request: ResourceReadRequest) -> ResourceReadResponse:
+async def read_resource(request: ResourceReadRequest) -> Response:
     """Read the contents of a specific resource."""
+    return Response(content=_read_resource(request), media_type="application/json")
+
+
+def _read_resource(request: ResourceReadRequest) -> bytes:
+    """Look up the prebuilt read reply for a resource."""
     logger.info("Resource read requested", uri=request.uri)
     
-    try:
-        # Get resource content
-        content_data = mcp_service.get_resource_content(request.uri)
-        
-        # Create resource content
-        resource_content = ResourceContent(
-            uri=request.uri,
-            mimeType="application/json",
-            text=str(content_data)  # Convert to JSON string
-        )
-        
-        response = ResourceReadResponse(
-            contents=[resource_content]
-        )
-        
-        logger.info("Resource content provided", uri=request.uri)
-        return response
-        
-    except ResourceNotFoundError as e:
+    response = _RESOURCE_READ_BYTES.get(request.uri)
+    if response is None:
         logger.warning("Resource not found", uri=request.uri)
-        raise HTTPException(status_code=404, detail=str(e))
-        
-    except Exception as e:
-        logger.error("Failed to read resource", uri=request.uri, error=str(e), exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Failed to read resource: {str(e)}")
+        raise HTTPException(status_code=404, detail=str(ResourceNotFoundError(request.uri)))
+    
+    logger.info("Resource content provided", uri=request.uri)
+    return response
 
 
 @router.post("/prompts/list", response_model=PromptsListResponse)
-async def list_prompts(request: PromptsListRequest = PromptsListRequest()) -> PromptsListResponse:
+async def list_prompts(request: PromptsListRequest = PromptsListRequest()) -> Response:
     """List all available astrological prompts."""
     logger.info("Prompts list requested", cursor=request.cursor)
-    
-    try:
-        prompts = mcp_service.list_prompts(request.cursor)
-        
-        response = PromptsListResponse(
-            prompts=prompts,
-            nextCursor=None  # No pagination for now
-        )
-        
-        logger.info("Prompts list provided", count=len(prompts))
-        return response
-        
-    except Exception as e:
-        logger.error("Failed to list prompts", error=str(e), exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Failed to list prompts: {str(e)}")
+    logger.info("Prompts list provided", count=len(PROMPTS_LIST_PAYLOAD["prompts"]))
+    return Response(content=_PROMPTS_LIST_BYTES, media_type="application/json")
 
 
 @router.post("/prompts/get", response_model=PromptGetResponse)
-async def get_prompt(request: PromptGetRequest) -> PromptGetResponse:
+async def get_prompt(request: PromptGetRequest) -> ORJSONResponse:
     """Get a formatted prompt with arguments."""
+    response = await _get_prompt(request)
+    return ORJSONResponse(content=response.model_dump())
+
+
+async def _get_prompt(request: PromptGetRequest) -> PromptGetResponse:
+    """Format a prompt with the supplied arguments."""
     logger.info("Prompt requested", name=request.name, arguments_keys=list(request.arguments.keys()) if request.arguments else [])
     
     try:
@@ -262,7 +303,7 @@ async def get_prompt(request: PromptGetRequest) -> PromptGetResponse:
         # Get prompt content
         messages = mcp_service.get_prompt_content(request.name, sanitized_args)
         
-        response = PromptGetResponse(
+        response = PromptGetResponse.model_construct(
             description=f"Formatted prompt for {request.name}",
             messages=messages
         )
@@ -280,176 +321,258 @@ async def get_prompt(request: PromptGetRequest) -> PromptGetResponse:
 
 
 # JSON-RPC endpoints (alternative transport)
-@router.post("/jsonrpc", response_model=JSONRPCResponse)
-async def jsonrpc_handler(request: JSONRPCRequest) -> JSONRPCResponse:
-    """Handle JSON-RPC requests for MCP protocol."""
-    logger.info("JSON-RPC request", method=request.method, id=request.id)
+_JSONRPC_REQUEST_SCHEMA = JSONRPCRequest.model_json_schema()
+
+
+@router.post(
+    "/jsonrpc",
+    response_model=JSONRPCResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "oneOf": [
+                            _JSONRPC_REQUEST_SCHEMA,
+                            {"type": "array", "items": _JSONRPC_REQUEST_SCHEMA}
+                        ]
+                    }
+                }
+            }
+        }
+    }
+)
+async def jsonrpc_handler(http_request: Request) -> Response:
+    """Handle JSON-RPC requests for MCP protocol, including batches."""
+    try:
+        payload = orjson.loads(await http_request.body())
+    except orjson.JSONDecodeError:
+        logger.warning("JSON-RPC parse error")
+        return _jsonrpc_response(_jsonrpc_error(None, -32700, "Parse error"))
+    
+    if not isinstance(payload, list):
+        reply = await _dispatch_batch_item(payload)
+        return _jsonrpc_response(reply) if reply is not None else _jsonrpc_no_content()
+    
+    settings = get_settings()
+    if not payload:
+        return _jsonrpc_response(_jsonrpc_error(None, -32600, "Invalid Request: empty batch"))
+    if len(payload) > settings.jsonrpc_max_batch_size:
+        logger.warning("JSON-RPC batch too large", size=len(payload))
+        return _jsonrpc_response(_jsonrpc_error(
+            None,
+            -32600,
+            f"Invalid Request: batch size exceeds {settings.jsonrpc_max_batch_size}"
+        ))
     
+    logger.info("JSON-RPC batch request", size=len(payload))
+    results = await asyncio.gather(*(_dispatch_batch_item(item) for item in payload))
+    
+    # Notifications get no reply; a batch of only notifications gets no body
+    replies = [reply for reply in results if reply is not None]
+    if not replies:
+        return _jsonrpc_no_content()
+    return _jsonrpc_response(b"[" + b",".join(replies) + b"]")
+
+
+async def _dispatch_batch_item(item: Any) -> Optional[bytes]:
+    """Validate and dispatch a single JSON-RPC request or batch entry."""
     try:
-        # Route to appropriate handler based on method
-        method_handlers = {
-            "initialize": handle_jsonrpc_initialize,
-            "tools/list": handle_jsonrpc_tools_list,
-            "tools/call": handle_jsonrpc_tools_call,
-            "resources/list": handle_jsonrpc_resources_list,
-            "resources/read": handle_jsonrpc_resources_read,
-            "prompts/list": handle_jsonrpc_prompts_list,
-            "prompts/get": handle_jsonrpc_prompts_get
-        }
-        
-        handler = method_handlers.get(request.method)
+        request = JSONRPCRequest.model_validate(item)
+    except PydanticValidationError as e:
+        request_id = item.get("id") if isinstance(item, dict) else None
+        if not isinstance(request_id, (str, int)):
+            request_id = None
+        logger.warning("Invalid JSON-RPC request", id=request_id, error_count=e.error_count())
+        return _jsonrpc_error(request_id, -32600, "Invalid Request")
+    
+    return await _dispatch_jsonrpc(request)
+
+
+def _jsonrpc_response(body: bytes) -> Response:
+    """Wrap a serialized JSON-RPC reply in an HTTP response."""
+    return Response(content=body, media_type="application/json")
+
+
+def _jsonrpc_no_content() -> Response:
+    """Answer a request that consisted only of notifications."""
+    return Response(status_code=204)
+
+
+def _jsonrpc_error(request_id: Union[str, int, None], code: int, message: str) -> bytes:
+    """Serialize a JSON-RPC error reply."""
+    return orjson.dumps({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message}
+    })
+
+
+async def _dispatch_jsonrpc(request: JSONRPCRequest) -> Optional[bytes]:
+    """Route a JSON-RPC request to its method handler and serialize the reply.
+    
+    Returns None for notifications (requests without an "id" member), which
+    are run but never answered.
+    """
+    is_notification = "id" not in request.model_fields_set
+    logger.info("JSON-RPC request", method=request.method, id=request.id, notification=is_notification)
+    
+    try:
+        handler = JSONRPC_METHOD_HANDLERS.get(request.method)
         if not handler:
             raise MCPProtocolError(f"Unknown method: {request.method}")
         
         result = await handler(request.params or {})
+        if is_notification:
+            return None
         
-        return JSONRPCResponse(
-            id=request.id,
-            result=result
-        )
+        # Handlers return serialized results, spliced into the envelope as is
+        return b'{"jsonrpc":"2.0","id":' + orjson.dumps(request.id) + b',"result":' + result + b'}'
         
     except Exception as e:
         logger.error("JSON-RPC request failed", method=request.method, error=str(e), exc_info=True)
+        if is_notification:
+            return None
         
-        error = MCPError(
-            code=-32603,  # Internal error
-            message=str(e)
-        )
-        
-        return JSONRPCResponse(
-            id=request.id,
-            error=error
-        )
+        return _jsonrpc_error(request.id, -32603, str(e))  # Internal error
 
 
 # Tool execution functions
-async def execute_tool(tool_name: str, arguments: Dict[str, Any]) -> Any:
-    """Execute a specific tool with given arguments."""
-    tool_executors = {
-        "generate_natal_chart": execute_generate_natal_chart,
-        "generate_progressed_chart": execute_generate_progressed_chart,
-        "generate_solar_return": execute_generate_solar_return,
-        "generate_composite_chart": execute_generate_composite_chart,
-        "calculate_synastry": execute_calculate_synastry,
-        "get_transits": execute_get_transits,
-        "interpret_aspects": execute_interpret_aspects,
-        "calculate_dignities": execute_calculate_dignities
-    }
-    
-    executor = tool_executors.get(tool_name)
+async def execute_tool(tool_name: str, arguments: Dict[str, Any]) -> bytes:
+    """Execute a specific tool and return its result as serialized JSON."""
+    executor = TOOL_EXECUTORS.get(tool_name)
     if not executor:
         raise ToolNotFoundError(tool_name)
     
     return await executor(arguments)
 
 
-async def execute_generate_natal_chart(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def execute_generate_natal_chart(arguments: Dict[str, Any]) -> bytes:
     """Execute natal chart generation."""
-    request = NatalChartRequest(**arguments)
+    request = _NATAL_REQUEST_ADAPTER.validate_python(arguments)
     chart_data = await chart_service.generate_natal_chart(request)
-    return chart_data.model_dump()
+    return chart_data.model_dump_json().encode()
 
 
-async def execute_generate_progressed_chart(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def execute_generate_progressed_chart(arguments: Dict[str, Any]) -> bytes:
     """Execute progressed chart generation."""
-    request = ProgressedChartRequest(**arguments)
+    request = _PROGRESSED_REQUEST_ADAPTER.validate_python(arguments)
     chart_data = await chart_service.generate_progressed_chart(request)
-    return chart_data.model_dump()
+    return chart_data.model_dump_json().encode()
 
 
-async def execute_generate_solar_return(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def execute_generate_solar_return(arguments: Dict[str, Any]) -> bytes:
     """Execute solar return chart generation."""
-    request = SolarReturnRequest(**arguments)
+    request = _SOLAR_RETURN_REQUEST_ADAPTER.validate_python(arguments)
     chart_data = await chart_service.generate_solar_return(request)
-    return chart_data.model_dump()
+    return chart_data.model_dump_json().encode()
 
 
-async def execute_generate_composite_chart(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def execute_generate_composite_chart(arguments: Dict[str, Any]) -> bytes:
     """Execute composite chart generation."""
-    request = CompositeChartRequest(**arguments)
+    request = _COMPOSITE_REQUEST_ADAPTER.validate_python(arguments)
     chart_data = await chart_service.generate_composite_chart(request)
-    return chart_data.model_dump()
+    return chart_data.model_dump_json().encode()
 
 
-async def execute_calculate_synastry(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def execute_calculate_synastry(arguments: Dict[str, Any]) -> bytes:
     """Execute synastry calculation."""
-    request = SynastryRequest(**arguments)
+    request = _SYNASTRY_REQUEST_ADAPTER.validate_python(arguments)
     synastry_data = await chart_service.calculate_synastry(request)
-    return synastry_data.model_dump()
+    return synastry_data.model_dump_json().encode()
 
 
-async def execute_get_transits(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def execute_get_transits(arguments: Dict[str, Any]) -> bytes:
     """Execute transit calculation."""
-    request = TransitsRequest(**arguments)
+    request = _TRANSITS_REQUEST_ADAPTER.validate_python(arguments)
     transits = await chart_service.get_transits(request)
-    return {"transits": [t.model_dump() for t in transits]}
+    return b'{"transits":' + _ASPECT_LIST_ADAPTER.dump_json(transits) + b'}'
 
 
-async def execute_interpret_aspects(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def execute_interpret_aspects(arguments: Dict[str, Any]) -> bytes:
     """Execute aspect interpretation."""
-    from app.models.astrology import ChartData
-    
-    chart_data = ChartData(**arguments["chart_data"])
+    chart_data = _CHART_DATA_ADAPTER.validate_python(arguments["chart_data"])
     detail_level = arguments.get("detail_level", "medium")
     
     interpretation = await chart_service.interpret_aspects(chart_data, detail_level)
-    return interpretation.model_dump()
+    return interpretation.model_dump_json().encode()
 
 
-async def execute_calculate_dignities(arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def execute_calculate_dignities(arguments: Dict[str, Any]) -> bytes:
     """Execute dignity calculation."""
-    from app.models.astrology import ChartData
-    
-    chart_data = ChartData(**arguments["chart_data"])
+    chart_data = _CHART_DATA_ADAPTER.validate_python(arguments["chart_data"])
     dignities = await chart_service.calculate_dignities(chart_data)
-    return {"dignities": [d.model_dump() for d in dignities]}
+    return b'{"dignities":' + _DIGNITY_LIST_ADAPTER.dump_json(dignities) + b'}'
+
+
+TOOL_EXECUTORS: Mapping[str, Callable[[Dict[str, Any]], Awaitable[bytes]]] = MappingProxyType({
+    "generate_natal_chart": execute_generate_natal_chart,
+    "generate_progressed_chart": execute_generate_progressed_chart,
+    "generate_solar_return": execute_generate_solar_return,
+    "generate_composite_chart": execute_generate_composite_chart,
+    "calculate_synastry": execute_calculate_synastry,
+    "get_transits": execute_get_transits,
+    "interpret_aspects": execute_interpret_aspects,
+    "calculate_dignities": execute_calculate_dignities
+})
 
 
 # JSON-RPC handlers
-async def handle_jsonrpc_initialize(params: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_jsonrpc_initialize(params: Dict[str, Any]) -> bytes:
     """Handle JSON-RPC initialize request."""
-    request = InitializeRequest(**params)
-    response = await initialize_mcp(request)
-    return response.model_dump()
+    request = InitializeRequest.model_validate(params)
+    return _initialize(request)
 
 
-async def handle_jsonrpc_tools_list(params: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_jsonrpc_tools_list(params: Dict[str, Any]) -> bytes:
     """Handle JSON-RPC tools list request."""
-    request = ToolsListRequest(**params)
-    response = await list_tools(request)
-    return response.model_dump()
+    request = ToolsListRequest.model_validate(params)
+    logger.info("Tools list requested", cursor=request.cursor)
+    return _TOOLS_LIST_BYTES
 
 
-async def handle_jsonrpc_tools_call(params: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_jsonrpc_tools_call(params: Dict[str, Any]) -> bytes:
     """Handle JSON-RPC tools call request."""
-    request = ToolCallRequest(**params)
-    response = await call_tool(request)
-    return response.model_dump()
+    request = ToolCallRequest.model_validate(params)
+    response = await _call_tool(request)
+    # Tool data is carried as a pre-serialized fragment, which only orjson can write
+    return await asyncio.to_thread(serialize_model, response)
 
 
-async def handle_jsonrpc_resources_list(params: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_jsonrpc_resources_list(params: Dict[str, Any]) -> bytes:
     """Handle JSON-RPC resources list request."""
-    request = ResourcesListRequest(**params)
-    response = await list_resources(request)
-    return response.model_dump()
+    request = ResourcesListRequest.model_validate(params)
+    logger.info("Resources list requested", cursor=request.cursor)
+    return _RESOURCES_LIST_BYTES
 
 
-async def handle_jsonrpc_resources_read(params: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_jsonrpc_resources_read(params: Dict[str, Any]) -> bytes:
     """Handle JSON-RPC resources read request."""
-    request = ResourceReadRequest(**params)
-    response = await read_resource(request)
-    return response.model_dump()
+    request = ResourceReadRequest.model_validate(params)
+    return _read_resource(request)
 
 
-async def handle_jsonrpc_prompts_list(params: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_jsonrpc_prompts_list(params: Dict[str, Any]) -> bytes:
     """Handle JSON-RPC prompts list request."""
-    request = PromptsListRequest(**params)
-    response = await list_prompts(request)
-    return response.model_dump()
+    request = PromptsListRequest.model_validate(params)
+    logger.info("Prompts list requested", cursor=request.cursor)
+    return _PROMPTS_LIST_BYTES
 
 
-async def handle_jsonrpc_prompts_get(params: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_jsonrpc_prompts_get(params: Dict[str, Any]) -> bytes:
     """Handle JSON-RPC prompts get request."""
-    request = PromptGetRequest(**params)
-    response = await get_prompt(request)
-    return response.model_dump()
\ No newline at end of file
+    request = PromptGetRequest.model_validate(params)
+    response = await _get_prompt(request)
+    return response.model_dump_json().encode()
+
+
+JSONRPC_METHOD_HANDLERS: Mapping[str, Callable[[Dict[str, Any]], Awaitable[bytes]]] = MappingProxyType({
+    "initialize": handle_jsonrpc_initialize,
+    "tools/list": handle_jsonrpc_tools_list,
+    "tools/call": handle_jsonrpc_tools_call,
+    "resources/list": handle_jsonrpc_resources_list,
+    "resources/read": handle_jsonrpc_resources_read,
+    "prompts/list": handle_jsonrpc_prompts_list,
+    "prompts/get": handle_jsonrpc_prompts_get
+})
@@ -5,17 +5,23 @@ This module provides high-level services for generating various types
 of astrological charts and performing calculations.
 """
 
-from typing import Any, Dict, List, Optional, Union
-from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Set, Tuple, TypeVar, Union
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import lru_cache
+from types import MappingProxyType
+import asyncio
+import importlib
 import json
 import re
 
-from app.config import get_settings
+from app.config import ASPECT_ORBS, get_settings
 from app.models.astrology import (
     ChartData,
     NatalChartRequest,
     ProgressedChartRequest,
     SolarReturnRequest,
+    CompositeChart,
     CompositeChartRequest,
     SynastryRequest,
     TransitsRequest,
@@ -24,58 +30,302 @@ from app.models.astrology import (
     Aspect,
     DignityScore,
     SynastryAnalysis,
-    Interpretation
+    Interpretation,
+    parse_iso_datetime
 )
 from app.utils.logging import get_logger
 from app.utils.exceptions import ChartGenerationError, ValidationError
+from app.utils.timestamps import utcnow_iso
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Major aspects checked between planet pairs, by ascending angle (match priority)
+_MAJOR_ASPECTS: Tuple[Tuple[int, str], ...] = (
+    (0, "conjunction"),
+    (60, "sextile"),
+    (90, "square"),
+    (120, "trine"),
+    (180, "opposition")
+)
+
+# Shared "generated_at" stamp for every chart built within one top-level request
+_BATCH_TIMESTAMP: ContextVar[Optional[str]] = ContextVar("_BATCH_TIMESTAMP", default=None)
+
+# Degree/direction/minute coordinates such as "32n43" or "117w09"
+_COORD_RE = re.compile(r"(\d+)([nswe])(\d+)")
+
+# Compatibility contribution of harmonious (+1) and challenging (-1) aspects
+_COMPATIBILITY_DELTAS: Mapping[str, int] = MappingProxyType({
+    "trine": 1,
+    "sextile": 1,
+    "conjunction": 1,
+    "square": -1,
+    "opposition": -1
+})
+
+# Interpretation verb, meaning and keywords per aspect type
+_ASPECT_META: Mapping[str, Tuple[str, str, Tuple[str, ...]]] = MappingProxyType({
+    "conjunction": ("conjunct", "Unified energy and focus", ("unity", "focus", "intensity")),
+    "sextile": ("sextile", "Harmonious opportunity for growth", ("opportunity", "harmony", "cooperation")),
+    "square": ("square", "Dynamic tension requiring resolution", ("challenge", "tension", "growth")),
+    "trine": ("trine", "Natural flow and ease", ("ease", "flow", "talent")),
+    "opposition": ("opposite", "Need for balance and integration", ("balance", "awareness", "integration"))
+})
+
+# Essential dignity score keyed by lowercased (planet, sign)
+_DIGNITY_SCORES: Mapping[Tuple[str, str], int] = MappingProxyType({
+    ("sun", "leo"): 5,
+    ("sun", "aries"): 4,
+    ("moon", "cancer"): 5,
+    ("moon", "taurus"): 4,
+    ("mercury", "gemini"): 5,
+    ("mercury", "virgo"): 5,
+    ("venus", "taurus"): 5,
+    ("venus", "libra"): 5,
+    ("mars", "aries"): 5,
+    ("mars", "scorpio"): 5,
+    ("jupiter", "sagittarius"): 5,
+    ("jupiter", "pisces"): 5,
+    ("saturn", "capricorn"): 5,
+    ("saturn", "aquarius"): 5
+})
+
+
+def _describe_aspect(aspect: Aspect) -> str:
+    """One-line interpretation of an aspect."""
+    meta = _ASPECT_META.get(aspect.aspect_type)
+    if meta is None:
+        return f"{aspect.planet1} {aspect.aspect_type} {aspect.planet2}"
+    return f"{aspect.planet1} {meta[0]} {aspect.planet2}: {meta[1]}"
+
+
+@lru_cache(maxsize=1024)
+def _parse_coordinate_str(coord: str) -> float:
+    """Parse a DMS or decimal coordinate string, memoizing repeated places."""
+    coord_str = coord.strip().lower()
+    
+    # Format like "32n43" or "117w09"
+    match = _COORD_RE.fullmatch(coord_str)
+    if match:
+        degrees = float(match.group(1))
+        direction = match.group(2)
+        minutes = float(match.group(3))
+        value = degrees + minutes / 60.0
+        if direction in ["s", "w"]:
+            value = -value
+        return value
+    
+    # Fall back to plain float string
+    try:
+        return float(coord_str)
+    except ValueError:
+        raise ValidationError(f"Invalid coordinate format: {coord}")
+
+
+def _field(value: Any, key: str, default: Any) -> Any:
+    """Read a field from an Immanuel value exposed as a dict or an object."""
+    if value is None:
+        return default
+    if isinstance(value, dict):
+        return value.get(key, default)
+    return getattr(value, key, default)
+
+
+class ImmanuelAPI(NamedTuple):
+    """The parts of the Immanuel library the chart builders call into."""
+    
+    charts: Any
+    chart_types: Any
+    version: str
+
+
+@lru_cache(maxsize=1)
+def import_immanuel() -> ImmanuelAPI:
+    """Import the Immanuel chart API once, logging its version on success.
+    
+    Resolved through sys.modules on first use rather than bound at import,
+    so tests can substitute the library.
+    """
+    immanuel = importlib.import_module("immanuel")
+    # Neither submodule is loaded by the package itself; the chart type
+    # constants (NATAL, COMPOSITE, ...) live in immanuel.const.chart
+    api = ImmanuelAPI(
+        charts=importlib.import_module("immanuel.charts"),
+        chart_types=importlib.import_module("immanuel.const.chart"),
+        version=getattr(immanuel, '__version__', None) or 'unknown'
+    )
+    
+    logger.info("Immanuel library loaded successfully", version=api.version)
+    return api
+
+
+def _require_immanuel() -> ImmanuelAPI:
+    """Return the Immanuel chart API, failing cleanly when it can't be imported."""
+    try:
+        return import_immanuel()
+    except ImportError as e:
+        logger.error("Failed to import Immanuel library", error=str(e))
+        raise ChartGenerationError(
+            "Immanuel astrology library is not available",
+            details={"import_error": str(e)}
+        )
+
+
+@lru_cache(maxsize=512)
+def _cached_chart(
+    date_time: str,
+    latitude: float,
+    longitude: float,
+    house_system: str,
+    chart_type: str,
+    progressed_date: Optional[str] = None,
+    time_is_utc: Optional[bool] = None
+) -> Any:
+    """Build an Immanuel chart, memoized on its normalized inputs."""
+    immanuel = _require_immanuel()
+    
+    subject_options = {} if time_is_utc is None else {"time_is_utc": time_is_utc}
+    chart_options = {} if progressed_date is None else {"progressed_date": progressed_date}
+    
+    native = immanuel.charts.Subject(
+        date_time=date_time,
+        latitude=latitude,
+        longitude=longitude,
+        **subject_options
+    )
+    
+    return immanuel.charts.Chart(
+        subject=native,
+        chart_type=getattr(immanuel.chart_types, chart_type),
+        house_system=house_system,
+        **chart_options
+    )
+
+
+# (name, longitude, speed) of each chart object with a position
+_TransitPositions = Tuple[Tuple[str, float, float], ...]
+
+
+@lru_cache(maxsize=2048)
+def _transit_positions_at(date_time: str, house_system: str) -> _TransitPositions:
+    """Geocentric object positions at a minute-truncated moment."""
+    chart = _cached_chart(date_time, 0.0, 0.0, house_system, "NATAL")
+    objects = getattr(chart, 'objects', None) or {}
+    return tuple(
+        (name, float(obj.longitude), float(getattr(obj, 'speed', 0.0)))
+        for name, obj in objects.items()
+        if getattr(obj, 'longitude', None) is not None
+    )
+
+
+def _natal_positions(natal_data: Mapping[str, Any]) -> _TransitPositions:
+    """(name, longitude, speed) of each usable planet in a raw natal chart."""
+    positions = []
+    for planet in natal_data.get("planets") or ():
+        if not isinstance(planet, dict):
+            continue
+        try:
+            longitude = float(planet["longitude"])
+            speed = float(planet.get("speed") or 0.0)
+        except (KeyError, TypeError, ValueError):
+            # Client-supplied charts may carry partial or malformed entries
+            continue
+        positions.append((str(planet.get("name", "unknown")), longitude, speed))
+    return tuple(positions)
+
+
+# (angle, aspect name, orb, largest orb of this and every wider aspect)
+_ResolvedAspectOrbs = Tuple[Tuple[float, str, float, float], ...]
+
+
+def _resolve_aspect_orbs(orbs: Mapping[str, float]) -> _ResolvedAspectOrbs:
+    """Pair each major aspect with its allowed orb and remaining reach."""
+    resolved = []
+    reach = 0.0
+    for degrees, name in reversed(_MAJOR_ASPECTS):
+        orb = orbs.get(name, 8.0)
+        reach = max(reach, orb)
+        resolved.append((float(degrees), name, orb, reach))
+    return tuple(reversed(resolved))
+
+
+_DEFAULT_ASPECT_ORBS = _resolve_aspect_orbs(ASPECT_ORBS)
+
+
+def _match_aspect(
+    name1: str,
+    longitude1: float,
+    speed1: float,
+    name2: str,
+    longitude2: float,
+    speed2: float,
+    aspect_orbs: _ResolvedAspectOrbs
+) -> Optional[Aspect]:
+    """Find the first major aspect formed between two planets."""
+    diff = abs(longitude1 - longitude2)
+    if diff > 180:
+        diff = 360 - diff
+    
+    for degrees, aspect_name, orb, reach in aspect_orbs:
+        # Angles only grow from here, so no later aspect can be in orb either
+        if degrees - diff > reach:
+            break
+        distance = abs(diff - degrees)
+        if distance <= orb:
+            # Every field is already a plain str/float/bool, so skip validation
+            return Aspect.model_construct(
+                planet1=name1,
+                planet2=name2,
+                aspect_type=aspect_name,
+                orb=distance,
+                exact_orb=degrees,
+                applying=speed1 > speed2,
+                separating=speed1 < speed2
+            )
+    
+    return None
+
 
 class ChartService:
     """Service for generating astrological charts using Immanuel."""
     
     def __init__(self) -> None:
         self.settings = get_settings()
-        self._validate_immanuel_import()
-    
-    def _validate_immanuel_import(self) -> None:
-        """Validate that Immanuel library is available."""
-        try:
-            import immanuel
-            logger.info("Immanuel library loaded successfully", version=getattr(immanuel, '__version__', 'unknown'))
-        except ImportError as e:
-            logger.error("Failed to import Immanuel library", error=str(e))
-            raise ChartGenerationError(
-                "Immanuel astrology library is not available",
-                details={"import_error": str(e)}
+        self._default_house_system = self.settings.default_house_system
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if self.settings.chart_workers > 0:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.settings.chart_workers,
+                thread_name_prefix="chart"
             )
     
+    def shutdown(self) -> None:
+        """Release the chart calculation workers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def clear_cache(self) -> None:
+        """Drop memoized Immanuel charts and transit positions."""
+        _cached_chart.cache_clear()
+        _transit_positions_at.cache_clear()
+    
+    async def _run_calculation(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking Immanuel calculation without stalling the event loop."""
+        if self._executor is None:
+            return func(*args)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
     async def generate_natal_chart(self, request: NatalChartRequest) -> ChartData:
         """Generate a natal chart."""
         try:
-            import immanuel
-            from immanuel import charts
-            from immanuel.const import chart_types
-            
             logger.info("Generating natal chart", date_time=request.date_time)
             
-            # Convert coordinates
-            lat, lon = self._convert_coordinates(request.coordinates.latitude, request.coordinates.longitude)
-            
-            # Create chart
-            native = charts.Subject(
-                date_time=request.date_time,
-                latitude=lat,
-                longitude=lon,
-                time_is_utc=request.timezone is None
-            )
-            
-            chart = charts.Chart(
-                subject=native,
-                chart_type=chart_types.NATAL,
-                house_system=request.house_system or self.settings.default_house_system
-            )
+            chart = await self._run_calculation(self._build_natal_chart_sync, request)
             
             # Convert to our format
             chart_data = await self._convert_immanuel_chart(chart, "natal", request)
@@ -87,38 +337,26 @@ class ChartService:
             logger.error("Failed to generate natal chart", error=str(e), exc_info=True)
             raise ChartGenerationError(f"Failed to generate natal chart: {str(e)}")
     
+    def _build_natal_chart_sync(self, request: NatalChartRequest) -> Any:
+        """Build the Immanuel natal chart; blocking, run on the chart workers."""
+        # Convert coordinates
+        lat, lon = self._convert_coordinates(request.coordinates.latitude, request.coordinates.longitude)
+        
+        return _cached_chart(
+            request.date_time,
+            lat,
+            lon,
+            request.house_system or self._default_house_system,
+            "NATAL",
+            time_is_utc=request.timezone is None
+        )
+    
     async def generate_progressed_chart(self, request: ProgressedChartRequest) -> ChartData:
         """Generate a progressed chart."""
         try:
-            import immanuel
-            from immanuel import charts
-            from immanuel.const import chart_types
-            
             logger.info("Generating progressed chart", progression_date=request.progression_date)
             
-            # Extract natal data from request
-            natal_data = request.natal_chart
-            lat, lon = self._convert_coordinates(request.coordinates.latitude, request.coordinates.longitude)
-            
-            # Create subjects
-            native = charts.Subject(
-                date_time=natal_data.get("date_time", request.date_time),
-                latitude=lat,
-                longitude=lon
-            )
-            
-            progressed = charts.Subject(
-                date_time=request.progression_date,
-                latitude=lat,
-                longitude=lon
-            )
-            
-            chart = charts.Chart(
-                subject=native,
-                chart_type=chart_types.PROGRESSED,
-                progressed_date=request.progression_date,
-                house_system=request.house_system or self.settings.default_house_system
-            )
+            chart = await self._run_calculation(self._build_progressed_chart_sync, request)
             
             chart_data = await self._convert_immanuel_chart(chart, "progressed", request)
             
@@ -129,42 +367,27 @@ class ChartService:
             logger.error("Failed to generate progressed chart", error=str(e), exc_info=True)
             raise ChartGenerationError(f"Failed to generate progressed chart: {str(e)}")
     
+    def _build_progressed_chart_sync(self, request: ProgressedChartRequest) -> Any:
+        """Build the Immanuel progressed chart; blocking, run on the chart workers."""
+        # Extract natal data from request
+        natal_data = request.natal_chart
+        lat, lon = self._convert_coordinates(request.coordinates.latitude, request.coordinates.longitude)
+        
+        return _cached_chart(
+            natal_data.get("date_time", request.date_time),
+            lat,
+            lon,
+            request.house_system or self._default_house_system,
+            "PROGRESSED",
+            progressed_date=request.progression_date
+        )
+    
     async def generate_solar_return(self, request: SolarReturnRequest) -> ChartData:
         """Generate a solar return chart."""
         try:
-            import immanuel
-            from immanuel import charts
-            from immanuel.const import chart_types
-            
             logger.info("Generating solar return chart", return_year=request.return_year)
             
-            # Use birth location unless return location specified
-            if request.return_location:
-                lat, lon = self._convert_coordinates(
-                    request.return_location.latitude, 
-                    request.return_location.longitude
-                )
-            else:
-                lat, lon = self._convert_coordinates(
-                    request.coordinates.latitude, 
-                    request.coordinates.longitude
-                )
-            
-            # Create solar return date
-            birth_data = request.birth_data
-            solar_return_date = f"{request.return_year}-{birth_data.date_time[5:10]} {birth_data.date_time[11:]}"
-            
-            native = charts.Subject(
-                date_time=solar_return_date,
-                latitude=lat,
-                longitude=lon
-            )
-            
-            chart = charts.Chart(
-                subject=native,
-                chart_type=chart_types.SOLAR_RETURN,
-                house_system=request.house_system or self.settings.default_house_system
-            )
+            chart = await self._run_calculation(self._build_solar_return_sync, request)
             
             chart_data = await self._convert_immanuel_chart(chart, "solar_return", request)
             
@@ -175,73 +398,106 @@ class ChartService:
             logger.error("Failed to generate solar return chart", error=str(e), exc_info=True)
             raise ChartGenerationError(f"Failed to generate solar return chart: {str(e)}")
     
-    async def generate_composite_chart(self, request: CompositeChartRequest) -> ChartData:
+    def _build_solar_return_sync(self, request: SolarReturnRequest) -> Any:
+        """Build the Immanuel solar return chart; blocking, run on the chart workers."""
+        # Use birth location unless return location specified
+        if request.return_location:
+            lat, lon = self._convert_coordinates(
+                request.return_location.latitude, 
+                request.return_location.longitude
+            )
+        else:
+            lat, lon = self._convert_coordinates(
+                request.coordinates.latitude, 
+                request.coordinates.longitude
+            )
+        
+        # Create solar return date
+        birth_data = request.birth_data
+        solar_return_date = f"{request.return_year}-{birth_data.date_time[5:10]} {birth_data.date_time[11:]}"
+        
+        return _cached_chart(
+            solar_return_date,
+            lat,
+            lon,
+            request.house_system or self._default_house_system,
+            "SOLAR_RETURN"
+        )
+    
+    async def generate_composite_chart(self, request: CompositeChartRequest) -> CompositeChart:
         """Generate a composite chart."""
         try:
-            import immanuel
-            from immanuel import charts
-            from immanuel.const import chart_types
-            
             logger.info("Generating composite chart")
             
-            # Convert coordinates for both people
-            lat1, lon1 = self._convert_coordinates(
-                request.person1.coordinates.latitude,
-                request.person1.coordinates.longitude
-            )
-            lat2, lon2 = self._convert_coordinates(
-                request.person2.coordinates.latitude,
-                request.person2.coordinates.longitude
-            )
-            
-            # Create subjects
-            person1 = charts.Subject(
-                date_time=request.person1.date_time,
-                latitude=lat1,
-                longitude=lon1
-            )
-            
-            person2 = charts.Subject(
-                date_time=request.person2.date_time,
-                latitude=lat2,
-                longitude=lon2
-            )
-            
-            chart = charts.Chart(
-                subject=person1,
-                partner=person2,
-                chart_type=chart_types.COMPOSITE,
-                house_system=request.house_system or self.settings.default_house_system
-            )
+            chart = await self._run_calculation(self._build_composite_chart_sync, request)
             
             chart_data = await self._convert_immanuel_chart(chart, "composite", request)
             
             logger.info("Composite chart generated successfully")
-            return chart_data
+            return CompositeChart(**{name: getattr(chart_data, name) for name in ChartData.model_fields})
             
         except Exception as e:
             logger.error("Failed to generate composite chart", error=str(e), exc_info=True)
             raise ChartGenerationError(f"Failed to generate composite chart: {str(e)}")
     
+    def _build_composite_chart_sync(self, request: CompositeChartRequest) -> Any:
+        """Build the Immanuel composite chart; blocking, run on the chart workers."""
+        immanuel = _require_immanuel()
+        
+        # Convert coordinates for both people
+        lat1, lon1 = self._convert_coordinates(
+            request.person1.coordinates.latitude,
+            request.person1.coordinates.longitude
+        )
+        lat2, lon2 = self._convert_coordinates(
+            request.person2.coordinates.latitude,
+            request.person2.coordinates.longitude
+        )
+        
+        # Create subjects
+        person1 = immanuel.charts.Subject(
+            date_time=request.person1.date_time,
+            latitude=lat1,
+            longitude=lon1
+        )
+        
+        person2 = immanuel.charts.Subject(
+            date_time=request.person2.date_time,
+            latitude=lat2,
+            longitude=lon2
+        )
+        
+        return immanuel.charts.Chart(
+            subject=person1,
+            partner=person2,
+            chart_type=immanuel.chart_types.COMPOSITE,
+            house_system=request.house_system or self._default_house_system
+        )
+    
     async def calculate_synastry(self, request: SynastryRequest) -> SynastryAnalysis:
         """Calculate synastry between two charts."""
         try:
             logger.info("Calculating synastry")
             
-            # Generate both natal charts
             chart1_req = NatalChartRequest(**request.person1.model_dump())
             chart2_req = NatalChartRequest(**request.person2.model_dump())
+            composite_req = CompositeChartRequest(person1=request.person1, person2=request.person2)
             
-            chart1 = await self.generate_natal_chart(chart1_req)
-            chart2 = await self.generate_natal_chart(chart2_req)
+            # Both natal charts and the composite are independent, so they
+            # are calculated concurrently and share one generation timestamp
+            token = _BATCH_TIMESTAMP.set(utcnow_iso())
+            try:
+                chart1, chart2, composite_chart = await asyncio.gather(
+                    self.generate_natal_chart(chart1_req),
+                    self.generate_natal_chart(chart2_req),
+                    self.generate_composite_chart(composite_req)
+                )
+            finally:
+                _BATCH_TIMESTAMP.reset(token)
             
             # Calculate interaspects
             interaspects = await self._calculate_interaspects(chart1, chart2, request.aspect_orbs)
             
-            # Generate composite chart
-            composite_req = CompositeChartRequest(person1=request.person1, person2=request.person2)
-            composite_chart = await self.generate_composite_chart(composite_req)
-            
             # Calculate compatibility score (simplified)
             compatibility_score = self._calculate_compatibility_score(interaspects)
             
@@ -263,30 +519,17 @@ class ChartService:
     async def get_transits(self, request: TransitsRequest) -> List[Aspect]:
         """Get current transits to a natal chart."""
         try:
-            import immanuel
-            from immanuel import charts
-            from immanuel.const import chart_types
-            
             logger.info("Calculating transits", transit_date=request.transit_date)
             
-            # Create transit chart
+            # Transits only need object positions, not a converted chart
             natal_data = request.natal_chart
-            
-            # Create subjects - simplified approach
-            transit_subject = charts.Subject(
-                date_time=request.transit_date,
-                latitude=0,  # Transits are calculated geocentrically
-                longitude=0
-            )
-            
-            chart = charts.Chart(
-                subject=transit_subject,
-                chart_type=chart_types.NATAL,
-                house_system=self.settings.default_house_system
-            )
+            positions = await self._run_calculation(self._build_transit_positions_sync, request)
+            if request.objects:
+                wanted = {name.lower() for name in request.objects}
+                positions = tuple(position for position in positions if position[0].lower() in wanted)
             
             # Calculate aspects between transit planets and natal planets
-            transits = await self._calculate_transit_aspects(natal_data, chart)
+            transits = await self._calculate_transit_aspects(natal_data, positions)
             
             logger.info("Transits calculated successfully", count=len(transits))
             return transits
@@ -295,17 +538,20 @@ class ChartService:
             logger.error("Failed to calculate transits", error=str(e), exc_info=True)
             raise ChartGenerationError(f"Failed to calculate transits: {str(e)}")
     
+    def _build_transit_positions_sync(self, request: TransitsRequest) -> _TransitPositions:
+        """Look up transiting positions; blocking, run on the chart workers."""
+        # Transits are calculated geocentrically; minute precision is enough
+        # for aspects and lets day-by-day scans share entries
+        moment = parse_iso_datetime(request.transit_date).replace(second=0, microsecond=0)
+        return _transit_positions_at(moment.isoformat(), self._default_house_system)
+    
     async def calculate_dignities(self, chart_data: ChartData) -> List[DignityScore]:
         """Calculate essential dignities for planets."""
         try:
             logger.info("Calculating dignities")
             
-            dignities = []
-            
             # Essential dignity scoring system
-            for planet in chart_data.planets:
-                score = self._calculate_planet_dignity(planet)
-                dignities.append(score)
+            dignities = [self._calculate_planet_dignity(planet) for planet in chart_data.planets]
             
             logger.info("Dignities calculated successfully", count=len(dignities))
             return dignities
@@ -319,19 +565,19 @@ class ChartService:
         try:
             logger.info("Interpreting aspects", detail_level=detail_level)
             
-            interpretations = []
-            keywords = []
+            interpretations = list(map(_describe_aspect, chart_data.aspects))
             
-            for aspect in chart_data.aspects:
-                interpretation = self._interpret_single_aspect(aspect, detail_level)
-                interpretations.append(interpretation)
-                keywords.extend(self._get_aspect_keywords(aspect))
+            # Keywords depend only on the aspect type, so collect them per distinct type
+            keywords: Set[str] = set()
+            for aspect_type in chart_data.aspects_by_type:
+                meta = _ASPECT_META.get(aspect_type)
+                keywords.update(meta[2] if meta is not None else ("aspect",))
             
             result = Interpretation(
                 interpretation_type="aspects",
                 summary=f"Analysis of {len(chart_data.aspects)} aspects in the chart",
                 detailed_analysis=interpretations,
-                keywords=list(set(keywords))
+                keywords=list(keywords)
             )
             
             logger.info("Aspects interpreted successfully")
@@ -344,80 +590,71 @@ class ChartService:
     def _convert_coordinates(self, lat: Union[str, float], lon: Union[str, float]) -> tuple[float, float]:
         """Convert coordinates to decimal degrees."""
         def parse_coordinate(coord: Union[str, float]) -> float:
+            if type(coord) is float:
+                return coord
             if isinstance(coord, (int, float)):
                 return float(coord)
-
             if isinstance(coord, str):
-                coord_str = coord.strip().lower()
-
-                # Format like "32n43" or "117w09"
-                match = re.fullmatch(r"(\d+)([nswe])(\d+)", coord_str)
-                if match:
-                    degrees = float(match.group(1))
-                    direction = match.group(2)
-                    minutes = float(match.group(3))
-                    value = degrees + minutes / 60.0
-                    if direction in ["s", "w"]:
-                        value = -value
-                    return value
-
-                # Fall back to plain float string
-                try:
-                    return float(coord_str)
-                except ValueError:
-                    pass
-
+                return _parse_coordinate_str(coord)
             raise ValidationError(f"Invalid coordinate format: {coord}")
         
-        return parse_coordinate(lat), parse_coordinate(lon)
+        # Rounded so equivalent inputs share a _cached_chart entry
+        return round(parse_coordinate(lat), 6), round(parse_coordinate(lon), 6)
     
-    async def _convert_immanuel_chart(self, chart: Any, chart_type: str, request: Any) -> ChartData:
+    async def _convert_immanuel_chart(
+        self,
+        chart: Any,
+        chart_type: str,
+        request: Any,
+        generated_at: Optional[str] = None
+    ) -> ChartData:
         """Convert Immanuel chart to our ChartData format."""
         try:
-            planets = []
-            houses = []
-            aspects = []
+            if generated_at is None:
+                generated_at = _BATCH_TIMESTAMP.get() or utcnow_iso()
+            
+            objects = getattr(chart, 'objects', None) or {}
+            planets = [
+                PlanetPosition(
+                    name=name,
+                    longitude=float(obj.longitude),
+                    latitude=getattr(obj, 'latitude', 0.0),
+                    distance=getattr(obj, 'distance', 0.0),
+                    speed=getattr(obj, 'speed', 0.0),
+                    sign=_field(getattr(obj, 'sign', None), 'name', ''),
+                    house=_field(getattr(obj, 'house', None), 'number', None)
+                )
+                for name, obj in objects.items()
+                if getattr(obj, 'longitude', None) is not None
+            ]
+            
+            chart_houses = getattr(chart, 'houses', None) or {}
+            houses = [
+                House(
+                    number=int(number),
+                    cusp=float(house.longitude),
+                    sign=_field(getattr(house, 'sign', None), 'name', '')
+                )
+                for number, house in chart_houses.items()
+                if getattr(house, 'longitude', None) is not None
+            ]
             
-            # Convert planets
-            if hasattr(chart, 'objects') and chart.objects:
-                for name, obj in chart.objects.items():
-                    if hasattr(obj, 'longitude'):
-                        planet = PlanetPosition(
-                            name=name,
-                            longitude=float(obj.longitude),
-                            latitude=getattr(obj, 'latitude', 0.0),
-                            distance=getattr(obj, 'distance', 0.0),
-                            speed=getattr(obj, 'speed', 0.0),
-                            sign=getattr(obj, 'sign', {}).get('name', '') if hasattr(obj, 'sign') else '',
-                            house=getattr(obj, 'house', {}).get('number', None) if hasattr(obj, 'house') else None
-                        )
-                        planets.append(planet)
-            
-            # Convert houses
-            if hasattr(chart, 'houses') and chart.houses:
-                for number, house in chart.houses.items():
-                    if hasattr(house, 'longitude'):
-                        house_obj = House(
-                            number=int(number),
-                            cusp=float(house.longitude),
-                            sign=getattr(house, 'sign', {}).get('name', '') if hasattr(house, 'sign') else ''
-                        )
-                        houses.append(house_obj)
-            
-            # Convert aspects
-            if hasattr(chart, 'aspects') and chart.aspects:
-                for aspect_data in chart.aspects:
-                    if hasattr(aspect_data, 'active') and hasattr(aspect_data, 'passive'):
-                        aspect = Aspect(
-                            planet1=getattr(aspect_data.active, 'name', 'unknown'),
-                            planet2=getattr(aspect_data.passive, 'name', 'unknown'),
-                            aspect_type=getattr(aspect_data, 'type', {}).get('name', 'unknown'),
-                            orb=float(getattr(aspect_data, 'orb', 0)),
-                            exact_orb=float(getattr(aspect_data, 'orb', 0)),
-                            applying=getattr(aspect_data, 'applying', False),
-                            separating=getattr(aspect_data, 'separating', False)
-                        )
-                        aspects.append(aspect)
+            aspects = []
+            for aspect_data in getattr(chart, 'aspects', None) or ():
+                active = getattr(aspect_data, 'active', None)
+                passive = getattr(aspect_data, 'passive', None)
+                if active is None or passive is None:
+                    continue
+                orb = float(getattr(aspect_data, 'orb', 0))
+                aspects.append(Aspect(
+                    planet1=getattr(active, 'name', 'unknown'),
+                    planet2=getattr(passive, 'name', 'unknown'),
+                    aspect_type=_field(getattr(aspect_data, 'type', None), 'name', 'unknown'),
+                    orb=orb,
+                    exact_orb=orb,
+                    applying=getattr(aspect_data, 'applying', False),
+                    separating=getattr(aspect_data, 'separating', False)
+                ))
             
             # Create chart data
             chart_data = ChartData(
@@ -425,13 +662,13 @@ class ChartService:
                 date_time=request.date_time,
                 coordinates=request.coordinates,
                 timezone=getattr(request, 'timezone', '') or 'UTC',
-                house_system=getattr(request, 'house_system', '') or self.settings.default_house_system,
+                house_system=getattr(request, 'house_system', '') or self._default_house_system,
                 planets=planets,
                 houses=houses,
                 aspects=aspects,
                 metadata={
-                    "generated_at": datetime.utcnow().isoformat(),
-                    "immanuel_version": getattr(__import__('immanuel'), '__version__', 'unknown')
+                    "generated_at": generated_at,
+                    "immanuel_version": import_immanuel().version
                 }
             )
             
@@ -443,92 +680,72 @@ class ChartService:
     
     async def _calculate_interaspects(self, chart1: ChartData, chart2: ChartData, custom_orbs: Optional[Dict[str, float]]) -> List[Aspect]:
         """Calculate aspects between two charts."""
-        from app.config import ASPECT_ORBS
+        # Resolve the orb for each aspect once rather than per planet pair
+        if custom_orbs:
+            aspect_orbs = _resolve_aspect_orbs({**ASPECT_ORBS, **custom_orbs})
+        else:
+            aspect_orbs = _DEFAULT_ASPECT_ORBS
         
-        interaspects = []
-        orbs = {**ASPECT_ORBS, **(custom_orbs or {})}
+        columns1 = chart1.planet_columns
+        columns2 = chart2.planet_columns
+        pairs2 = tuple(zip(columns2.names, columns2.longitudes, columns2.speeds))
         
-        for planet1 in chart1.planets:
-            for planet2 in chart2.planets:
-                aspect = self._calculate_aspect(planet1, planet2, orbs)
+        interaspects = []
+        for name1, longitude1, speed1 in zip(columns1.names, columns1.longitudes, columns1.speeds):
+            for name2, longitude2, speed2 in pairs2:
+                aspect = _match_aspect(name1, longitude1, speed1, name2, longitude2, speed2, aspect_orbs)
                 if aspect:
                     interaspects.append(aspect)
         
         return interaspects
     
-    async def _calculate_transit_aspects(self, natal_data: Dict[str, Any], transit_chart: Any) -> List[Aspect]:
-        """Calculate aspects between transiting and natal planets."""
-        # Simplified transit calculation
-        # In a full implementation, this would extract planetary positions
-        # from both charts and calculate aspects
-        return []
-    
-    def _calculate_aspect(self, planet1: PlanetPosition, planet2: PlanetPosition, orbs: Dict[str, float]) -> Optional[Aspect]:
-        """Calculate aspect between two planets."""
-        diff = abs(planet1.longitude - planet2.longitude)
-        if diff > 180:
-            diff = 360 - diff
+    async def _calculate_transit_aspects(self, natal_data: Dict[str, Any], positions: _TransitPositions) -> List[Aspect]:
+        """Calculate aspects between transiting and natal planets.
         
-        # Check for major aspects
-        aspects_to_check = [
-            (0, "conjunction"),
-            (60, "sextile"),
-            (90, "square"),
-            (120, "trine"),
-            (180, "opposition")
-        ]
+        planet1 is always the transiting body and planet2 the natal one;
+        the interpretation spells this out for clients.
+        """
+        natal_planets = _natal_positions(natal_data)
         
-        for degrees, aspect_name in aspects_to_check:
-            orb = orbs.get(aspect_name, 8.0)
-            if abs(diff - degrees) <= orb:
-                return Aspect(
-                    planet1=planet1.name,
-                    planet2=planet2.name,
-                    aspect_type=aspect_name,
-                    orb=abs(diff - degrees),
-                    exact_orb=degrees,
-                    applying=planet1.speed > planet2.speed,
-                    separating=planet1.speed < planet2.speed
+        transits = []
+        for transit_name, transit_longitude, transit_speed in positions:
+            for natal_name, natal_longitude, natal_speed in natal_planets:
+                aspect = _match_aspect(
+                    transit_name, transit_longitude, transit_speed,
+                    natal_name, natal_longitude, natal_speed,
+                    _DEFAULT_ASPECT_ORBS
                 )
+                if aspect:
+                    transits.append(aspect.model_copy(update={
+                        "interpretation": f"Transiting {transit_name} {aspect.aspect_type} natal {natal_name}"
+                    }))
         
-        return None
+        return transits
+    
+    def _calculate_aspect(self, planet1: PlanetPosition, planet2: PlanetPosition, orbs: Mapping[str, float]) -> Optional[Aspect]:
+        """Calculate aspect between two planets."""
+        return _match_aspect(
+            planet1.name, planet1.longitude, planet1.speed,
+            planet2.name, planet2.longitude, planet2.speed,
+            _resolve_aspect_orbs(orbs)
+        )
     
     def _calculate_compatibility_score(self, aspects: List[Aspect]) -> float:
         """Calculate a simple compatibility score based on aspects."""
         if not aspects:
             return 0.0
         
-        harmonious = ["trine", "sextile", "conjunction"]
-        challenging = ["square", "opposition"]
-        
-        positive_score = sum(1 for aspect in aspects if aspect.aspect_type in harmonious)
-        negative_score = sum(1 for aspect in aspects if aspect.aspect_type in challenging)
-        
-        total_aspects = len(aspects)
-        if total_aspects == 0:
-            return 0.0
+        delta = sum(_COMPATIBILITY_DELTAS.get(aspect.aspect_type, 0) for aspect in aspects)
         
         # Simple scoring: (positive - negative) / total, normalized to 0-100
-        raw_score = (positive_score - negative_score) / total_aspects
+        raw_score = delta / len(aspects)
         return max(0, min(100, (raw_score + 1) * 50))
     
     def _calculate_planet_dignity(self, planet: PlanetPosition) -> DignityScore:
         """Calculate essential dignity score for a planet."""
         # Simplified dignity calculation
         # In a full implementation, this would check rulership, exaltation, etc.
-        
-        dignity_map = {
-            "sun": {"leo": 5, "aries": 4},
-            "moon": {"cancer": 5, "taurus": 4},
-            "mercury": {"gemini": 5, "virgo": 5},
-            "venus": {"taurus": 5, "libra": 5},
-            "mars": {"aries": 5, "scorpio": 5},
-            "jupiter": {"sagittarius": 5, "pisces": 5},
-            "saturn": {"capricorn": 5, "aquarius": 5}
-        }
-        
-        planet_dignities = dignity_map.get(planet.name.lower(), {})
-        sign_score = planet_dignities.get(planet.sign.lower(), 0)
+        sign_score = _DIGNITY_SCORES.get((planet.name.lower(), planet.sign.lower()), 0)
         
         return DignityScore(
             planet=planet.name,
@@ -538,27 +755,3 @@ class ChartService:
             exalted=4 if sign_score == 4 else 0,
             total_score=sign_score
         )
-    
-    def _interpret_single_aspect(self, aspect: Aspect, detail_level: str) -> str:
-        """Generate interpretation for a single aspect."""
-        basic_interpretations = {
-            "conjunction": f"{aspect.planet1} conjunct {aspect.planet2}: Unified energy and focus",
-            "sextile": f"{aspect.planet1} sextile {aspect.planet2}: Harmonious opportunity for growth",
-            "square": f"{aspect.planet1} square {aspect.planet2}: Dynamic tension requiring resolution",
-            "trine": f"{aspect.planet1} trine {aspect.planet2}: Natural flow and ease",
-            "opposition": f"{aspect.planet1} opposite {aspect.planet2}: Need for balance and integration"
-        }
-        
-        return basic_interpretations.get(aspect.aspect_type, f"{aspect.planet1} {aspect.aspect_type} {aspect.planet2}")
-    
-    def _get_aspect_keywords(self, aspect: Aspect) -> List[str]:
-        """Get keywords for an aspect."""
-        keyword_map = {
-            "conjunction": ["unity", "focus", "intensity"],
-            "sextile": ["opportunity", "harmony", "cooperation"],
-            "square": ["challenge", "tension", "growth"],
-            "trine": ["ease", "flow", "talent"],
-            "opposition": ["balance", "awareness", "integration"]
-        }
-        
-        return keyword_map.get(aspect.aspect_type, ["aspect"])
\ No newline at end of file
@@ -6,15 +6,97 @@ coordinates, dates, and other astrological inputs.
 """
 
 import re
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
+from zoneinfo import available_timezones
 
-from app.config import HOUSE_SYSTEMS, DEFAULT_PLANETS, EXTENDED_OBJECTS
+from app.config import CHART_TYPES, HOUSE_SYSTEMS, DEFAULT_PLANETS, EXTENDED_OBJECTS
+from app.models.astrology import parse_iso_datetime
 from app.utils.exceptions import ValidationError
 from app.utils.logging import get_logger
+from app.utils.sanitize import sanitize_input
 
 logger = get_logger(__name__)
 
+# DMS coordinate format, e.g. "32n43" or "117w09"
+_DMS_COORD_RE = re.compile(r'^(\d+(?:\.\d+)?)[nsewNSEW](\d+(?:\.\d+)?)?$')
+
+# Numeric UTC offsets such as +05:30 or -0800
+_UTC_OFFSET_RE = re.compile(r'^[+-]\d{2}:?\d{2}$')
+
+# Common abbreviations accepted alongside the IANA names
+_TIMEZONE_ABBREVIATIONS = frozenset({
+    "UTC", "GMT", "EST", "EDT", "CST", "CDT", "MST", "MDT", "PST", "PDT"
+})
+
+
+@lru_cache(maxsize=1)
+def _known_timezones() -> FrozenSet[str]:
+    """Return the IANA timezone names, read from the tz database on first use."""
+    return frozenset(available_timezones()) | _TIMEZONE_ABBREVIATIONS
+
+
+# Allow-lists: tuples keep the documented order for error messages,
+# frozensets back the membership checks
+_ASPECT_NAMES = (
+    "conjunction", "opposition", "trine", "square", "sextile",
+    "quincunx", "semisextile", "semisquare", "sesquisquare"
+)
+_VALID_ASPECTS = frozenset(_ASPECT_NAMES)
+_ORB_TYPES = frozenset({int, float})
+_VALID_CHART_TYPES = frozenset(CHART_TYPES)
+_INTERP_TYPE_NAMES = ("natal", "aspects", "transits", "synastry", "progression")
+_VALID_INTERP_TYPES = frozenset(_INTERP_TYPE_NAMES)
+_LEVEL_NAMES = ("basic", "medium", "detailed")
+_VALID_LEVELS = frozenset(_LEVEL_NAMES)
+_DEFAULT_OBJECT_SET = frozenset(DEFAULT_PLANETS)
+_EXTENDED_OBJECT_SET = frozenset(EXTENDED_OBJECTS)
+
+# Required keys for chart data and each tool's arguments
+_CHART_DATA_FIELDS = frozenset({"chart_type", "date_time", "coordinates", "planets", "houses"})
+_NATAL_CHART_FIELDS = frozenset({"date_time", "latitude", "longitude"})
+_PROGRESSED_CHART_FIELDS = frozenset({"natal_chart", "progression_date"})
+_SOLAR_RETURN_FIELDS = frozenset({"birth_data", "return_year"})
+_PERSON_PAIR_FIELDS = frozenset({"person1", "person2"})
+_TRANSITS_FIELDS = frozenset({"natal_chart", "transit_date"})
+
+
+def _require_fields(data: Mapping[str, Any], required: FrozenSet[str], where: str = "") -> None:
+    """Raise a ValidationError naming every required key missing from data."""
+    missing = required.difference(data)
+    if missing:
+        plural = "s" if len(missing) > 1 else ""
+        raise ValidationError(f"Missing required field{plural}{where}: {', '.join(sorted(missing))}")
+
+
+@lru_cache(maxsize=1)
+def _current_year(hour: int) -> int:
+    """Return the local year, recomputed only when the hour bucket changes."""
+    return datetime.now().year
+
+
+_DMS_DIRECTIONS = frozenset("nsew")
+
+
+def _split_dms_coordinate(coord: str) -> Tuple[str, float]:
+    """Split a DMS coordinate into its lowercased direction and degrees."""
+    # Fast path for whole degrees and minutes, e.g. "32n43" or "117w"
+    head = coord.rstrip("0123456789")
+    degrees = head[:-1]
+    direction = head[-1:].lower()
+    if direction in _DMS_DIRECTIONS and degrees.isascii() and degrees.isdecimal():
+        return direction, float(degrees)
+    
+    # Fractional parts and malformed input go through the full pattern
+    match = _DMS_COORD_RE.match(coord)
+    if not match:
+        raise ValidationError(f"Invalid coordinate format: {coord}. Expected format like '32n43' or decimal degrees")
+    degrees = match.group(1)
+    return coord[len(degrees)].lower(), float(degrees)
+
 
 class ValidationService:
     """Service for validating astrological inputs."""
@@ -23,8 +105,8 @@ class ValidationService:
     def validate_datetime(date_time: str) -> bool:
         """Validate datetime format."""
         try:
-            # Try to parse ISO format
-            datetime.fromisoformat(date_time.replace('Z', '+00:00'))
+            # Shares the memoized parser used by the request models
+            parse_iso_datetime(date_time)
             return True
         except ValueError:
             raise ValidationError(f"Invalid datetime format: {date_time}. Expected ISO format (YYYY-MM-DD HH:MM:SS)")
@@ -34,7 +116,7 @@ class ValidationService:
         """Validate geographic coordinates."""
         def validate_single_coordinate(coord: Union[str, float], coord_type: str) -> bool:
             if isinstance(coord, (int, float)):
-                # Decimal degrees
+                # Decimal degrees; chained comparisons also reject NaN
                 if coord_type == "latitude" and not -90 <= coord <= 90:
                     raise ValidationError(f"Latitude must be between -90 and 90 degrees: {coord}")
                 elif coord_type == "longitude" and not -180 <= coord <= 180:
@@ -43,18 +125,7 @@ class ValidationService:
             
             elif isinstance(coord, str):
                 # DMS format like "32n43" or "117w09"
-                pattern = r'^(\d+(?:\.\d+)?)[nsewNSEW](\d+(?:\.\d+)?)?$'
-                if not re.match(pattern, coord):
-                    raise ValidationError(f"Invalid coordinate format: {coord}. Expected format like '32n43' or decimal degrees")
-                
-                # Extract numeric part and direction
-                direction = coord[-1].lower()
-                numeric_part = coord[:-1]
-                
-                try:
-                    value = float(numeric_part)
-                except ValueError:
-                    raise ValidationError(f"Invalid numeric value in coordinate: {coord}")
+                direction, value = _split_dms_coordinate(coord)
                 
                 # Validate ranges based on direction
                 if direction in ['n', 's'] and not 0 <= value <= 90:
@@ -84,14 +155,20 @@ class ValidationService:
     @staticmethod
     def validate_objects(objects: List[str], allow_extended: bool = False) -> bool:
         """Validate astrological objects list."""
-        valid_objects = EXTENDED_OBJECTS if allow_extended else DEFAULT_PLANETS
-        
-        for obj in objects:
-            if obj not in valid_objects:
-                raise ValidationError(
-                    f"Invalid object: {obj}. "
-                    f"Supported objects: {', '.join(valid_objects)}"
-                )
+        valid_set = _EXTENDED_OBJECT_SET if allow_extended else _DEFAULT_OBJECT_SET
+        
+        try:
+            all_valid = valid_set.issuperset(objects)
+        except TypeError:  # unhashable entries can't be supported objects
+            all_valid = False
+        
+        if not all_valid:
+            valid_objects = EXTENDED_OBJECTS if allow_extended else DEFAULT_PLANETS
+            bad = next(obj for obj in objects if obj not in valid_objects)
+            raise ValidationError(
+                f"Invalid object: {bad}. "
+                f"Supported objects: {', '.join(valid_objects)}"
+            )
         return True
     
     @staticmethod
@@ -100,19 +177,10 @@ class ValidationService:
         if timezone is None:
             return True
         
-        # Basic timezone validation
-        # In a full implementation, you might use pytz to validate
         if not isinstance(timezone, str) or len(timezone) == 0:
             raise ValidationError("Timezone must be a non-empty string")
         
-        # Common timezone patterns
-        valid_patterns = [
-            r'^[A-Z]{3,4}$',  # UTC, GMT, EST, etc.
-            r'^[+-]\d{2}:?\d{2}$',  # +05:30, -0800, etc.
-            r'^[A-Za-z_]+/[A-Za-z_]+$',  # America/New_York, etc.
-        ]
-        
-        if not any(re.match(pattern, timezone) for pattern in valid_patterns):
+        if timezone not in _known_timezones() and not _UTC_OFFSET_RE.match(timezone):
             logger.warning("Timezone format not recognized", timezone=timezone)
         
         return True
@@ -126,19 +194,17 @@ class ValidationService:
         if not isinstance(aspect_orbs, dict):
             raise ValidationError("Aspect orbs must be a dictionary")
         
-        valid_aspects = [
-            "conjunction", "opposition", "trine", "square", "sextile",
-            "quincunx", "semisextile", "semisquare", "sesquisquare"
-        ]
+        if not _VALID_ASPECTS.issuperset(aspect_orbs):
+            bad = next(aspect for aspect in aspect_orbs if aspect not in _VALID_ASPECTS)
+            raise ValidationError(
+                f"Invalid aspect type: {bad}. "
+                f"Supported aspects: {', '.join(_ASPECT_NAMES)}"
+            )
         
         for aspect, orb in aspect_orbs.items():
-            if aspect not in valid_aspects:
-                raise ValidationError(
-                    f"Invalid aspect type: {aspect}. "
-                    f"Supported aspects: {', '.join(valid_aspects)}"
-                )
-            
-            if not isinstance(orb, (int, float)) or orb < 0 or orb > 30:
+            # Exact type check first; subclasses fall back to isinstance
+            is_number = type(orb) in _ORB_TYPES or isinstance(orb, (int, float))
+            if not is_number or orb < 0 or orb > 30:
                 raise ValidationError(f"Invalid orb value for {aspect}: {orb}. Must be between 0 and 30 degrees")
         
         return True
@@ -146,18 +212,13 @@ class ValidationService:
     @staticmethod
     def validate_chart_data(chart_data: Dict[str, Any]) -> bool:
         """Validate chart data structure."""
-        required_fields = ["chart_type", "date_time", "coordinates", "planets", "houses"]
-        
-        for field in required_fields:
-            if field not in chart_data:
-                raise ValidationError(f"Missing required field in chart data: {field}")
+        _require_fields(chart_data, _CHART_DATA_FIELDS, " in chart data")
         
         # Validate chart type
-        valid_chart_types = ["natal", "progressed", "solar_return", "composite", "synastry", "transits"]
-        if chart_data["chart_type"] not in valid_chart_types:
+        if chart_data["chart_type"] not in _VALID_CHART_TYPES:
             raise ValidationError(
                 f"Invalid chart type: {chart_data['chart_type']}. "
-                f"Supported types: {', '.join(valid_chart_types)}"
+                f"Supported types: {', '.join(CHART_TYPES)}"
             )
         
         # Validate datetime
@@ -183,7 +244,7 @@ class ValidationService:
     @staticmethod
     def validate_year(year: int) -> bool:
         """Validate year for solar returns, progressions, etc."""
-        current_year = datetime.now().year
+        current_year = _current_year(int(time.time() // 3600))
         
         if not isinstance(year, int):
             raise ValidationError("Year must be an integer")
@@ -207,19 +268,17 @@ class ValidationService:
         ValidationService.validate_chart_data(chart_data)
         
         # Validate interpretation type
-        valid_types = ["natal", "aspects", "transits", "synastry", "progression"]
-        if interpretation_type not in valid_types:
+        if interpretation_type not in _VALID_INTERP_TYPES:
             raise ValidationError(
                 f"Invalid interpretation type: {interpretation_type}. "
-                f"Supported types: {', '.join(valid_types)}"
+                f"Supported types: {', '.join(_INTERP_TYPE_NAMES)}"
             )
         
         # Validate detail level
-        valid_levels = ["basic", "medium", "detailed"]
-        if detail_level not in valid_levels:
+        if detail_level not in _VALID_LEVELS:
             raise ValidationError(
                 f"Invalid detail level: {detail_level}. "
-                f"Supported levels: {', '.join(valid_levels)}"
+                f"Supported levels: {', '.join(_LEVEL_NAMES)}"
             )
         
         return True
@@ -227,43 +286,13 @@ class ValidationService:
     @staticmethod
     def sanitize_input(value: Any) -> Any:
         """Sanitize input values to prevent injection attacks."""
-        if isinstance(value, str):
-            # Remove potentially dangerous characters
-            dangerous_chars = ['<', '>', '&', '"', "'", '`', '\x00']
-            for char in dangerous_chars:
-                value = value.replace(char, '')
-            
-            # Limit string length
-            if len(value) > 1000:
-                raise ValidationError("Input string too long (max 1000 characters)")
-            
-            return value.strip()
-        
-        elif isinstance(value, dict):
-            return {k: ValidationService.sanitize_input(v) for k, v in value.items()}
-        
-        elif isinstance(value, list):
-            return [ValidationService.sanitize_input(item) for item in value]
-        
-        else:
-            return value
+        return sanitize_input(value)
     
     @staticmethod
     def validate_mcp_tool_arguments(tool_name: str, arguments: Dict[str, Any]) -> bool:
         """Validate arguments for specific MCP tools."""
         # Tool-specific validation
-        validators = {
-            "generate_natal_chart": ValidationService._validate_natal_chart_args,
-            "generate_progressed_chart": ValidationService._validate_progressed_chart_args,
-            "generate_solar_return": ValidationService._validate_solar_return_args,
-            "generate_composite_chart": ValidationService._validate_composite_chart_args,
-            "calculate_synastry": ValidationService._validate_synastry_args,
-            "get_transits": ValidationService._validate_transits_args,
-            "interpret_aspects": ValidationService._validate_interpret_aspects_args,
-            "calculate_dignities": ValidationService._validate_dignities_args
-        }
-        
-        validator = validators.get(tool_name)
+        validator = TOOL_ARGUMENT_VALIDATORS.get(tool_name)
         if validator:
             return validator(arguments)
         
@@ -273,15 +302,15 @@ class ValidationService:
     @staticmethod
     def _validate_natal_chart_args(args: Dict[str, Any]) -> bool:
         """Validate natal chart generation arguments."""
-        # Required fields
-        required = ["date_time", "latitude", "longitude"]
-        for field in required:
-            if field not in args:
-                raise ValidationError(f"Missing required field: {field}")
+        _require_fields(args, _NATAL_CHART_FIELDS)
         
         # Validate each field
-        ValidationService.validate_datetime(args["date_time"])
-        ValidationService.validate_coordinates(args["latitude"], args["longitude"])
+        try:
+            _validate_birth_moment(args["date_time"], args["latitude"], args["longitude"])
+        except TypeError:
+            # Unhashable values can't be memoized; validate them directly
+            ValidationService.validate_datetime(args["date_time"])
+            ValidationService.validate_coordinates(args["latitude"], args["longitude"])
         
         if "timezone" in args:
             ValidationService.validate_timezone(args["timezone"])
@@ -297,10 +326,7 @@ class ValidationService:
     @staticmethod
     def _validate_progressed_chart_args(args: Dict[str, Any]) -> bool:
         """Validate progressed chart generation arguments."""
-        required = ["natal_chart", "progression_date"]
-        for field in required:
-            if field not in args:
-                raise ValidationError(f"Missing required field: {field}")
+        _require_fields(args, _PROGRESSED_CHART_FIELDS)
         
         ValidationService.validate_chart_data(args["natal_chart"])
         ValidationService.validate_datetime(args["progression_date"])
@@ -313,10 +339,7 @@ class ValidationService:
     @staticmethod
     def _validate_solar_return_args(args: Dict[str, Any]) -> bool:
         """Validate solar return generation arguments."""
-        required = ["birth_data", "return_year"]
-        for field in required:
-            if field not in args:
-                raise ValidationError(f"Missing required field: {field}")
+        _require_fields(args, _SOLAR_RETURN_FIELDS)
         
         # Validate birth data structure
         birth_data = args["birth_data"]
@@ -335,10 +358,7 @@ class ValidationService:
     @staticmethod
     def _validate_composite_chart_args(args: Dict[str, Any]) -> bool:
         """Validate composite chart generation arguments."""
-        required = ["person1", "person2"]
-        for field in required:
-            if field not in args:
-                raise ValidationError(f"Missing required field: {field}")
+        _require_fields(args, _PERSON_PAIR_FIELDS)
         
         ValidationService._validate_natal_chart_args(args["person1"])
         ValidationService._validate_natal_chart_args(args["person2"])
@@ -351,10 +371,7 @@ class ValidationService:
     @staticmethod
     def _validate_synastry_args(args: Dict[str, Any]) -> bool:
         """Validate synastry calculation arguments."""
-        required = ["person1", "person2"]
-        for field in required:
-            if field not in args:
-                raise ValidationError(f"Missing required field: {field}")
+        _require_fields(args, _PERSON_PAIR_FIELDS)
         
         ValidationService._validate_natal_chart_args(args["person1"])
         ValidationService._validate_natal_chart_args(args["person2"])
@@ -367,10 +384,7 @@ class ValidationService:
     @staticmethod
     def _validate_transits_args(args: Dict[str, Any]) -> bool:
         """Validate transits calculation arguments."""
-        required = ["natal_chart", "transit_date"]
-        for field in required:
-            if field not in args:
-                raise ValidationError(f"Missing required field: {field}")
+        _require_fields(args, _TRANSITS_FIELDS)
         
         ValidationService.validate_chart_data(args["natal_chart"])
         ValidationService.validate_datetime(args["transit_date"])
@@ -389,8 +403,7 @@ class ValidationService:
         ValidationService.validate_chart_data(args["chart_data"])
         
         if "detail_level" in args:
-            valid_levels = ["basic", "medium", "detailed"]
-            if args["detail_level"] not in valid_levels:
+            if args["detail_level"] not in _VALID_LEVELS:
                 raise ValidationError(f"Invalid detail level: {args['detail_level']}")
         
         return True
@@ -402,4 +415,25 @@ class ValidationService:
             raise ValidationError("Missing required field: chart_data")
         
         ValidationService.validate_chart_data(args["chart_data"])
-        return True
\ No newline at end of file
+        return True
+
+
+@lru_cache(maxsize=1024)
+def _validate_birth_moment(date_time: str, latitude: Union[str, float], longitude: Union[str, float]) -> bool:
+    """Validate a birth datetime and location, memoizing inputs that passed."""
+    ValidationService.validate_datetime(date_time)
+    ValidationService.validate_coordinates(latitude, longitude)
+    return True
+
+
+# Tool argument validators, bound once instead of on every tool call
+TOOL_ARGUMENT_VALIDATORS: Mapping[str, Callable[[Dict[str, Any]], bool]] = MappingProxyType({
+    "generate_natal_chart": ValidationService._validate_natal_chart_args,
+    "generate_progressed_chart": ValidationService._validate_progressed_chart_args,
+    "generate_solar_return": ValidationService._validate_solar_return_args,
+    "generate_composite_chart": ValidationService._validate_composite_chart_args,
+    "calculate_synastry": ValidationService._validate_synastry_args,
+    "get_transits": ValidationService._validate_transits_args,
+    "interpret_aspects": ValidationService._validate_interpret_aspects_args,
+    "calculate_dignities": ValidationService._validate_dignities_args
+})
@@ -21,23 +21,40 @@ def add_correlation_id(logger: Any, method_name: str, event_dict: EventDict) ->
     return event_dict
 
 
+# Keys whose values are redacted, compared case-insensitively
+_SENSITIVE_KEYS = frozenset({"password", "token", "api_key", "secret"})
+
+
+def _is_sensitive(key: str) -> bool:
+    """Check a key against the sensitive set, lowercasing only when needed."""
+    if key in _SENSITIVE_KEYS:
+        return True
+    # Already-lowercase keys (the usual case) can't match after lowering
+    return not key.islower() and key.lower() in _SENSITIVE_KEYS
+
+
+def _filter_dict(d: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively filter sensitive keys from dictionary."""
+    # Most events carry neither secrets nor nested dicts; pass them through
+    if (
+        not any(map(_is_sensitive, d))
+        and not any(isinstance(value, dict) for value in d.values())
+    ):
+        return d
+    
+    filtered: Dict[str, Any] = {}
+    for key, value in d.items():
+        if _is_sensitive(key):
+            filtered[key] = "[REDACTED]"
+        elif isinstance(value, dict):
+            filtered[key] = _filter_dict(value)
+        else:
+            filtered[key] = value
+    return filtered
+
+
 def filter_sensitive_data(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """Filter sensitive data from log entries."""
-    sensitive_keys = {"password", "token", "api_key", "secret"}
-    
-    def _filter_dict(d: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively filter sensitive keys from dictionary."""
-        filtered = {}
-        for key, value in d.items():
-            if key.lower() in sensitive_keys:
-                filtered[key] = "[REDACTED]"
-            elif isinstance(value, dict):
-                filtered[key] = _filter_dict(value)
-            else:
-                filtered[key] = value
-        return filtered
-    
-    # Filter the event dict itself
     return _filter_dict(event_dict)
 
 
@@ -61,6 +78,8 @@ def configure_logging(log_level: str = "INFO", is_development: bool = True) -> N
     
     # Define processors
     processors: list[Processor] = [
+        # Drop records below the configured level before any other work
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
         structlog.processors.StackInfoRenderer(),
@@ -108,11 +127,18 @@ def configure_mcp_logging(log_level: str = "INFO") -> None:
             logging.FileHandler(log_file, mode='a', encoding='utf-8')
         ],
         level=getattr(logging, log_level.upper()),
-        force=True  # Override any existing configuration
     )
     
+    # Send uvicorn logs through the root file handler instead of the console
+    for name in ("uvicorn", "uvicorn.access", "uvicorn.error"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
+    
     # Define processors for file output (no colors, structured)
     processors: list[Processor] = [
+        # Drop records below the configured level before any other work
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
         structlog.processors.StackInfoRenderer(),
@@ -0,0 +1,44 @@
+"""
+Response classes for the Immanuel MCP Server.
+
+This module provides JSON response classes backed by orjson for faster
+serialization of API responses.
+"""
+
+import asyncio
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def serialize_model(model: BaseModel) -> bytes:
+    """Serialize a model with orjson, keeping any pre-serialized fragments."""
+    return orjson.dumps(model.model_dump(), option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+    
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes."""
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class PydanticResponse(JSONResponse):
+    """JSON response for large models, serialized in a worker thread."""
+    
+    media_type = "application/json"
+    
+    def render(self, content: bytes) -> bytes:
+        """Pass through the body already serialized by create."""
+        return content
+    
+    @classmethod
+    async def create(cls, content: BaseModel, status_code: int = 200) -> "PydanticResponse":
+        """Build a response without serializing on the event loop."""
+        body = await asyncio.to_thread(serialize_model, content)
+        return cls(content=body, status_code=status_code)
@@ -0,0 +1,51 @@
+"""
+Input sanitization helpers for the Immanuel MCP Server.
+
+This module strips characters commonly used in injection attacks from
+client-supplied values before they reach validation or calculation code.
+"""
+
+from typing import Any
+
+from app.utils.exceptions import ValidationError
+
+# Characters removed from every client-supplied string
+_DANGEROUS_CHARS = str.maketrans("", "", "<>&\"'`\x00")
+_DANGEROUS_BYTES = b"<>&\"'`\x00"
+
+# Longest string accepted after sanitization
+MAX_INPUT_LENGTH = 1000
+
+# Value types that sanitize_input may rewrite; anything else passes through
+_SANITIZED_TYPES = (str, dict, list)
+
+
+def sanitize_input(value: Any) -> Any:
+    """Sanitize input values to prevent injection attacks."""
+    if isinstance(value, str):
+        # Remove potentially dangerous characters; bytes.translate is several
+        # times faster than str.translate for the usual short ASCII values
+        if value.isascii():
+            value = value.encode("ascii").translate(None, _DANGEROUS_BYTES).decode("ascii")
+        else:
+            value = value.translate(_DANGEROUS_CHARS)
+        
+        # Limit string length
+        if len(value) > MAX_INPUT_LENGTH:
+            raise ValidationError(f"Input string too long (max {MAX_INPUT_LENGTH} characters)")
+        
+        return value.strip()
+    
+    elif isinstance(value, dict):
+        # Purely numeric payloads (positions, degrees) need no copy
+        if not any(isinstance(v, _SANITIZED_TYPES) for v in value.values()):
+            return value
+        return {k: sanitize_input(v) for k, v in value.items()}
+    
+    elif isinstance(value, list):
+        if not any(isinstance(item, _SANITIZED_TYPES) for item in value):
+            return value
+        return [sanitize_input(item) for item in value]
+    
+    else:
+        return value
@@ -0,0 +1,29 @@
+"""
+Timestamp helpers for the Immanuel MCP Server.
+
+This module provides cheap ISO-8601 timestamps for response payloads,
+formatted at most once per second. Every response uses the same form:
+naive UTC to whole seconds, e.g. "2024-01-01T12:00:00".
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Tuple
+
+# (whole second, formatted timestamp) for the most recent call
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def utcnow() -> datetime:
+    """Get the current UTC time as a naive datetime, to whole seconds."""
+    return datetime.fromtimestamp(int(time.time()), timezone.utc).replace(tzinfo=None)
+
+
+def utcnow_iso() -> str:
+    """Get the current UTC time as an ISO string, cached per second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        formatted = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat()
+        _ts_cache = (now, formatted)
+    return _ts_cache[1]
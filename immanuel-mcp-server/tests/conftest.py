@@ -5,25 +5,119 @@ This module provides common test fixtures and configuration
 for the test suite.
 """
 
+import sys
+from types import SimpleNamespace
+
+import orjson
 import pytest
-from typing import Any, Dict, Generator
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any, Callable, Dict, Generator, List, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi.testclient import TestClient
-from app.main import app
-from app.config import get_settings
-from app.services.mcp_service import MCPService
-from app.services.chart_service import ChartService
-from app.services.validation import ValidationService
 
 
-@pytest.fixture
-def test_client() -> TestClient:
-    """Create a test client for the FastAPI application."""
-    return TestClient(app)
+def _build_immanuel_mock() -> MagicMock:
+    """Build the mock Immanuel module."""
+    mock = MagicMock()
+    
+    # Mock chart creation; plain namespaces for the data, since
+    # MagicMock(name=...) doesn't set the .name attribute
+    mock_chart = MagicMock()
+    mock_chart.objects = {
+        'sun': SimpleNamespace(
+            longitude=120.5,
+            latitude=0.0,
+            distance=1.0,
+            speed=1.0,
+            sign=SimpleNamespace(name='leo'),
+            house=SimpleNamespace(number=5)
+        ),
+        'moon': SimpleNamespace(
+            longitude=45.3,
+            latitude=5.2,
+            distance=0.002,
+            speed=13.2,
+            sign=SimpleNamespace(name='taurus'),
+            house=SimpleNamespace(number=2)
+        )
+    }
+    
+    mock_chart.houses = {
+        1: SimpleNamespace(longitude=0.0, sign=SimpleNamespace(name='aries')),
+        2: SimpleNamespace(longitude=30.0, sign=SimpleNamespace(name='taurus')),
+        3: SimpleNamespace(longitude=60.0, sign=SimpleNamespace(name='gemini'))
+    }
+    
+    mock_chart.aspects = [
+        SimpleNamespace(
+            active=SimpleNamespace(name='sun'),
+            passive=SimpleNamespace(name='moon'),
+            type=SimpleNamespace(name='trine'),
+            orb=2.5,
+            applying=True,
+            separating=False
+        )
+    ]
+    
+    # Mock charts module
+    mock.charts.Chart.return_value = mock_chart
+    mock.charts.Subject = MagicMock
+    
+    # Mock chart types
+    mock.const.chart.NATAL = 'natal'
+    mock.const.chart.PROGRESSED = 'progressed'
+    mock.const.chart.SOLAR_RETURN = 'solar_return'
+    mock.const.chart.COMPOSITE = 'composite'
+    
+    return mock
 
 
-@pytest.fixture
+def _immanuel_modules(mock: MagicMock) -> Dict[str, Any]:
+    """sys.modules entries for the mock package and the submodules the app imports."""
+    return {
+        "immanuel": mock,
+        "immanuel.charts": mock.charts,
+        "immanuel.const": mock.const,
+        "immanuel.const.chart": mock.const.chart
+    }
+
+
+# The chart builders resolve Immanuel lazily through sys.modules; install the
+# mock before the app is imported so no test reaches the real library
+IMMANUEL_MOCK = _build_immanuel_mock()
+sys.modules.update(_immanuel_modules(IMMANUEL_MOCK))
+
+from app.main import app  # noqa: E402
+from app.routes import mcp as mcp_routes  # noqa: E402
+from app.models.astrology import ChartData, NatalChartRequest  # noqa: E402
+from app.services.mcp_service import MCPService  # noqa: E402
+from app.services.chart_service import ChartService, import_immanuel  # noqa: E402
+from app.services.validation import ValidationService  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def test_client() -> Generator[TestClient, None, None]:
+    """Create a test client for the FastAPI application.
+    
+    Entering the client runs the startup and shutdown events once and keeps
+    one event loop thread alive for every request in the session.
+    """
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def post_json(test_client: TestClient) -> Callable[[str, Any], Any]:
+    """POST payloads encoded with orjson instead of the client's stdlib json."""
+    headers = {"content-type": "application/json"}
+    
+    def post(url: str, payload: Any) -> Any:
+        return test_client.post(url, content=orjson.dumps(payload), headers=headers)
+    
+    return post
+
+
+@pytest.fixture(scope="session")
 def test_settings() -> Dict[str, Any]:
     """Test configuration settings."""
     return {
@@ -38,75 +132,40 @@ def test_settings() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture(scope="session")
+def immanuel_mock_tree() -> MagicMock:
+    """The mock Immanuel module the suite runs against."""
+    return IMMANUEL_MOCK
+
+
 @pytest.fixture
-def mock_immanuel() -> Generator[MagicMock, None, None]:
+def mock_immanuel(immanuel_mock_tree: MagicMock) -> Generator[MagicMock, None, None]:
     """Mock the Immanuel library for testing."""
-    with pytest.mock.patch('immanuel') as mock:
-        # Mock chart creation
-        mock_chart = MagicMock()
-        mock_chart.objects = {
-            'sun': MagicMock(
-                longitude=120.5,
-                latitude=0.0,
-                distance=1.0,
-                speed=1.0,
-                sign=MagicMock(name='leo'),
-                house=MagicMock(number=5)
-            ),
-            'moon': MagicMock(
-                longitude=45.3,
-                latitude=5.2,
-                distance=0.002,
-                speed=13.2,
-                sign=MagicMock(name='taurus'),
-                house=MagicMock(number=2)
-            )
-        }
-        
-        mock_chart.houses = {
-            1: MagicMock(longitude=0.0, sign=MagicMock(name='aries')),
-            2: MagicMock(longitude=30.0, sign=MagicMock(name='taurus')),
-            3: MagicMock(longitude=60.0, sign=MagicMock(name='gemini'))
-        }
-        
-        mock_chart.aspects = [
-            MagicMock(
-                active=MagicMock(name='sun'),
-                passive=MagicMock(name='moon'),
-                type=MagicMock(name='trine'),
-                orb=2.5,
-                applying=True,
-                separating=False
-            )
-        ]
-        
-        # Mock charts module
-        mock.charts.Chart.return_value = mock_chart
-        mock.charts.Subject = MagicMock
-        
-        # Mock chart types
-        mock.const.chart_types.NATAL = 'natal'
-        mock.const.chart_types.PROGRESSED = 'progressed'
-        mock.const.chart_types.SOLAR_RETURN = 'solar_return'
-        mock.const.chart_types.COMPOSITE = 'composite'
-        
-        yield mock
+    with patch.dict(sys.modules, _immanuel_modules(immanuel_mock_tree)):
+        # Keep the memoized import from handing the mock to later tests
+        import_immanuel.cache_clear()
+        yield immanuel_mock_tree
+        import_immanuel.cache_clear()
+    # Drop recorded calls and any side effects a test installed
+    immanuel_mock_tree.reset_mock(side_effect=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_natal_request() -> Dict[str, Any]:
     """Sample natal chart request data."""
     return {
         "date_time": "1990-05-15 14:30:00",
-        "latitude": "32n43",
-        "longitude": "117w09",
+        "coordinates": {
+            "latitude": "32n43",
+            "longitude": "117w09"
+        },
         "timezone": "America/Los_Angeles",
         "house_system": "placidus",
         "objects": ["sun", "moon", "mercury", "venus", "mars"]
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_chart_data() -> Dict[str, Any]:
     """Sample chart data for testing."""
     return {
@@ -160,19 +219,51 @@ def sample_chart_data() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mcp_service() -> MCPService:
     """Create an MCP service instance for testing."""
     return MCPService()
 
 
+@pytest.fixture(scope="module")
+def shared_chart_service() -> Generator[ChartService, None, None]:
+    """Create one chart service per test module."""
+    service = ChartService()
+    yield service
+    service.shutdown()
+
+
 @pytest.fixture
-def chart_service() -> ChartService:
-    """Create a chart service instance for testing."""
-    return ChartService()
+def chart_service(shared_chart_service: ChartService) -> ChartService:
+    """Provide the module's chart service with its chart caches emptied."""
+    shared_chart_service.clear_cache()
+    return shared_chart_service
 
 
 @pytest.fixture
+def stub_chart_conversion(
+    chart_service: ChartService,
+    monkeypatch: pytest.MonkeyPatch
+) -> Callable[[ChartData], List[Tuple[Any, ...]]]:
+    """Swap chart conversion for a stub returning the given chart data.
+    
+    Calling the fixture installs the stub and returns the list of
+    argument tuples it was called with.
+    """
+    def install(chart_data: ChartData) -> List[Tuple[Any, ...]]:
+        calls: List[Tuple[Any, ...]] = []
+        
+        async def convert(*args: Any, **kwargs: Any) -> ChartData:
+            calls.append(args)
+            return chart_data
+        
+        monkeypatch.setattr(chart_service, "_convert_immanuel_chart", convert)
+        return calls
+    
+    return install
+
+
+@pytest.fixture(scope="module")
 def validation_service() -> ValidationService:
     """Create a validation service instance for testing."""
     return ValidationService()
@@ -180,14 +271,25 @@ def validation_service() -> ValidationService:
 
 @pytest.fixture
 def mock_chart_service() -> Generator[AsyncMock, None, None]:
-    """Mock chart service for testing."""
-    with pytest.mock.patch('app.services.chart_service.ChartService') as mock:
-        mock_instance = AsyncMock()
-        mock.return_value = mock_instance
+    """Mock the chart service instance the MCP routes call into."""
+    mock_instance = AsyncMock(spec=ChartService)
+    with patch.object(mcp_routes, "chart_service", mock_instance):
         yield mock_instance
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def natal_request_model(sample_natal_request: Dict[str, Any]) -> NatalChartRequest:
+    """Validated natal chart request, shared by a module's tests."""
+    return NatalChartRequest(**sample_natal_request)
+
+
+@pytest.fixture(scope="session")
+def chart_data_model(sample_chart_data: Dict[str, Any]) -> ChartData:
+    """Validated chart data, built once per session; ChartData is frozen, so sharing it is safe."""
+    return ChartData.model_validate(sample_chart_data)
+
+
+@pytest.fixture(scope="session")
 def sample_mcp_initialize_request() -> Dict[str, Any]:
     """Sample MCP initialize request."""
     return {
@@ -204,7 +306,14 @@ def sample_mcp_initialize_request() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mcp_initialized(test_client: TestClient, sample_mcp_initialize_request: Dict[str, Any]) -> None:
+    """Complete the MCP initialize handshake once for the session."""
+    response = test_client.post("/mcp/initialize", json=sample_mcp_initialize_request)
+    assert response.status_code == 200
+
+
+@pytest.fixture(scope="session")
 def sample_tool_call_request() -> Dict[str, Any]:
     """Sample MCP tool call request."""
     return {
@@ -218,7 +327,7 @@ def sample_tool_call_request() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_synastry_request() -> Dict[str, Any]:
     """Sample synastry request data."""
     return {
@@ -241,7 +350,7 @@ def sample_synastry_request() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transit_request() -> Dict[str, Any]:
     """Sample transit request data."""
     return {
@@ -263,7 +372,52 @@ def sample_transit_request() -> Dict[str, Any]:
     }
 
 
-# Test markers
-pytest.mark.unit = pytest.mark.unit
-pytest.mark.integration = pytest.mark.integration
-pytest.mark.slow = pytest.mark.slow
\ No newline at end of file
+# Markers that --fast leaves out of the run
+_SLOW_MARKERS = ("slow", "integration")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the --fast and --perf options."""
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="deselect tests marked slow or integration",
+    )
+    parser.addoption(
+        "--perf",
+        action="store_true",
+        default=False,
+        help="also run tests marked perf",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the suite's markers."""
+    config.addinivalue_line("markers", "unit: fast, isolated tests")
+    config.addinivalue_line("markers", "integration: tests that exercise the full application")
+    config.addinivalue_line("markers", "slow: tests too slow for quick iteration")
+    config.addinivalue_line("markers", "perf: timing and load checks, run only with --perf")
+    config.addinivalue_line("markers", "benchmark(**options): pytest-benchmark round and warmup settings")
+    config.addinivalue_line("markers", "xdist_group(name): run tests on the same xdist worker")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """Apply --fast/--perf deselection and group each module onto one xdist worker."""
+    skipped_markers = _SLOW_MARKERS if config.getoption("--fast") else ()
+    if not config.getoption("--perf"):
+        skipped_markers += ("perf",)
+    
+    if skipped_markers:
+        kept: List[pytest.Item] = []
+        deselected: List[pytest.Item] = []
+        for item in items:
+            skipped = any(item.get_closest_marker(name) for name in skipped_markers)
+            (deselected if skipped else kept).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = kept
+    
+    # Keeps module-scoped fixtures to one build per module
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(item.module.__name__))
@@ -5,10 +5,15 @@ This module tests chart generation, calculations, and conversions
 using the Immanuel astrology library.
 """
 
+import re
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from typing import Any, Dict
+from unittest.mock import MagicMock, patch
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError as PydanticValidationError
 
+from app.config import ASPECT_ORBS
 from app.services.chart_service import ChartService
 from app.models.astrology import (
     NatalChartRequest,
@@ -18,26 +23,41 @@ from app.models.astrology import (
     SynastryRequest,
     TransitsRequest,
     GeographicCoordinate,
-    ChartData
+    ChartData,
+    CompositeChart,
+    PlanetPosition,
+    Aspect
 )
 from app.utils.exceptions import ChartGenerationError, ValidationError
+from app.utils.timestamps import utcnow_iso
+
+
+# Birth locations shared by the tests; the models are frozen, so reuse is safe
+SAN_DIEGO_COORDS = GeographicCoordinate(latitude="32n43", longitude="117w09")
+NEW_YORK_COORDS = GeographicCoordinate(latitude="40n45", longitude="73w59")
 
 
 @pytest.mark.unit
 class TestChartService:
     """Test chart service functionality."""
     
-    def test_init_validates_immanuel_import(self, mock_immanuel: MagicMock) -> None:
-        """Test that ChartService validates Immanuel import on initialization."""
-        service = ChartService()
+    def test_init_does_not_require_immanuel(self) -> None:
+        """Test that ChartService can be built before Immanuel is importable."""
+        with patch('app.services.chart_service.import_immanuel', side_effect=ImportError("No module named 'immanuel'")):
+            service = ChartService()
         assert service is not None
     
-    def test_init_fails_without_immanuel(self) -> None:
-        """Test that ChartService fails without Immanuel library."""
+    @pytest.mark.asyncio
+    async def test_generate_fails_without_immanuel(
+        self,
+        chart_service: ChartService,
+        natal_request_model: NatalChartRequest
+    ) -> None:
+        """Test that chart generation fails cleanly without Immanuel library."""
         with patch('app.services.chart_service.import_immanuel', side_effect=ImportError("No module named 'immanuel'")):
             with pytest.raises(ChartGenerationError) as exc_info:
-                ChartService()
-            assert "Immanuel astrology library is not available" in str(exc_info.value)
+                await chart_service.generate_natal_chart(natal_request_model)
+        assert "Immanuel astrology library is not available" in str(exc_info.value)
     
     def test_convert_coordinates_decimal_degrees(self, chart_service: ChartService) -> None:
         """Test coordinate conversion from decimal degrees."""
@@ -60,46 +80,42 @@ class TestChartService:
     async def test_generate_natal_chart_success(
         self, 
         chart_service: ChartService, 
-        sample_natal_request: Dict[str, Any],
-        mock_immanuel: MagicMock
+        natal_request_model: NatalChartRequest,
+        mock_immanuel: MagicMock,
+        stub_chart_conversion: Callable[[ChartData], List[Tuple[Any, ...]]]
     ) -> None:
         """Test successful natal chart generation."""
-        request = NatalChartRequest(**sample_natal_request)
+        mock_chart_data = ChartData(
+            chart_type="natal",
+            date_time=natal_request_model.date_time,
+            coordinates=natal_request_model.coordinates,
+            timezone="America/Los_Angeles",
+            house_system="placidus",
+            planets=[],
+            houses=[],
+            aspects=[],
+            metadata={}
+        )
+        conversions = stub_chart_conversion(mock_chart_data)
         
-        with patch.object(chart_service, '_convert_immanuel_chart') as mock_convert:
-            mock_chart_data = ChartData(
-                chart_type="natal",
-                date_time=request.date_time,
-                coordinates=request.coordinates,
-                timezone="America/Los_Angeles",
-                house_system="placidus",
-                planets=[],
-                houses=[],
-                aspects=[],
-                metadata={}
-            )
-            mock_convert.return_value = mock_chart_data
-            
-            result = await chart_service.generate_natal_chart(request)
-            
-            assert result.chart_type == "natal"
-            assert result.date_time == request.date_time
-            mock_convert.assert_called_once()
+        result = await chart_service.generate_natal_chart(natal_request_model)
+        
+        assert result.chart_type == "natal"
+        assert result.date_time == natal_request_model.date_time
+        assert len(conversions) == 1
     
     @pytest.mark.asyncio
     async def test_generate_natal_chart_immanuel_error(
         self, 
         chart_service: ChartService, 
-        sample_natal_request: Dict[str, Any],
+        natal_request_model: NatalChartRequest,
         mock_immanuel: MagicMock
     ) -> None:
         """Test natal chart generation with Immanuel error."""
-        request = NatalChartRequest(**sample_natal_request)
-        
         mock_immanuel.charts.Chart.side_effect = Exception("Immanuel error")
         
         with pytest.raises(ChartGenerationError) as exc_info:
-            await chart_service.generate_natal_chart(request)
+            await chart_service.generate_natal_chart(natal_request_model)
         
         assert "Failed to generate natal chart" in str(exc_info.value)
     
@@ -108,7 +124,8 @@ class TestChartService:
         self, 
         chart_service: ChartService,
         sample_chart_data: Dict[str, Any],
-        mock_immanuel: MagicMock
+        mock_immanuel: MagicMock,
+        stub_chart_conversion: Callable[[ChartData], List[Tuple[Any, ...]]]
     ) -> None:
         """Test successful progressed chart generation."""
         request = ProgressedChartRequest(
@@ -118,99 +135,99 @@ class TestChartService:
             coordinates=GeographicCoordinate(**sample_chart_data["coordinates"])
         )
         
-        with patch.object(chart_service, '_convert_immanuel_chart') as mock_convert:
-            mock_chart_data = ChartData(
-                chart_type="progressed",
-                date_time=request.date_time,
-                coordinates=request.coordinates,
-                timezone="UTC",
-                house_system="placidus",
-                planets=[],
-                houses=[],
-                aspects=[],
-                metadata={}
-            )
-            mock_convert.return_value = mock_chart_data
-            
-            result = await chart_service.generate_progressed_chart(request)
-            
-            assert result.chart_type == "progressed"
-            mock_convert.assert_called_once()
+        mock_chart_data = ChartData(
+            chart_type="progressed",
+            date_time=request.date_time,
+            coordinates=request.coordinates,
+            timezone="UTC",
+            house_system="placidus",
+            planets=[],
+            houses=[],
+            aspects=[],
+            metadata={}
+        )
+        conversions = stub_chart_conversion(mock_chart_data)
+        
+        result = await chart_service.generate_progressed_chart(request)
+        
+        assert result.chart_type == "progressed"
+        assert len(conversions) == 1
     
     @pytest.mark.asyncio
     async def test_generate_solar_return_success(
         self, 
         chart_service: ChartService,
-        mock_immanuel: MagicMock
+        mock_immanuel: MagicMock,
+        stub_chart_conversion: Callable[[ChartData], List[Tuple[Any, ...]]]
     ) -> None:
         """Test successful solar return chart generation."""
         birth_data = NatalChartRequest(
             date_time="1990-05-15 14:30:00",
-            coordinates=GeographicCoordinate(latitude="32n43", longitude="117w09")
+            coordinates=SAN_DIEGO_COORDS
         )
         
         request = SolarReturnRequest(
             birth_data=birth_data,
             return_year=2024,
             date_time="2024-05-15 14:30:00",
-            coordinates=GeographicCoordinate(latitude="32n43", longitude="117w09")
+            coordinates=SAN_DIEGO_COORDS
         )
         
-        with patch.object(chart_service, '_convert_immanuel_chart') as mock_convert:
-            mock_chart_data = ChartData(
-                chart_type="solar_return",
-                date_time=request.date_time,
-                coordinates=request.coordinates,
-                timezone="UTC",
-                house_system="placidus",
-                planets=[],
-                houses=[],
-                aspects=[],
-                metadata={}
-            )
-            mock_convert.return_value = mock_chart_data
-            
-            result = await chart_service.generate_solar_return(request)
-            
-            assert result.chart_type == "solar_return"
-            mock_convert.assert_called_once()
+        mock_chart_data = ChartData(
+            chart_type="solar_return",
+            date_time=request.date_time,
+            coordinates=request.coordinates,
+            timezone="UTC",
+            house_system="placidus",
+            planets=[],
+            houses=[],
+            aspects=[],
+            metadata={}
+        )
+        conversions = stub_chart_conversion(mock_chart_data)
+        
+        result = await chart_service.generate_solar_return(request)
+        
+        assert result.chart_type == "solar_return"
+        assert len(conversions) == 1
     
     @pytest.mark.asyncio
     async def test_generate_composite_chart_success(
         self, 
         chart_service: ChartService,
-        mock_immanuel: MagicMock
+        mock_immanuel: MagicMock,
+        stub_chart_conversion: Callable[[ChartData], List[Tuple[Any, ...]]]
     ) -> None:
         """Test successful composite chart generation."""
         person1 = NatalChartRequest(
             date_time="1990-05-15 14:30:00",
-            coordinates=GeographicCoordinate(latitude="32n43", longitude="117w09")
+            coordinates=SAN_DIEGO_COORDS
         )
         person2 = NatalChartRequest(
             date_time="1992-08-22 10:15:00",
-            coordinates=GeographicCoordinate(latitude="40n45", longitude="73w59")
+            coordinates=NEW_YORK_COORDS
         )
         
         request = CompositeChartRequest(person1=person1, person2=person2)
         
-        with patch.object(chart_service, '_convert_immanuel_chart') as mock_convert:
-            mock_chart_data = ChartData(
-                chart_type="composite",
-                date_time="1991-06-18 12:22:30",  # Midpoint
-                coordinates=GeographicCoordinate(latitude=36.0, longitude=-95.0),
-                timezone="UTC",
-                house_system="placidus",
-                planets=[],
-                houses=[],
-                aspects=[],
-                metadata={}
-            )
-            mock_convert.return_value = mock_chart_data
-            
-            result = await chart_service.generate_composite_chart(request)
-            
-            assert result.chart_type == "composite"
-            mock_convert.assert_called_once()
+        mock_chart_data = ChartData(
+            chart_type="composite",
+            date_time="1991-06-18 12:22:30",  # Midpoint
+            coordinates=GeographicCoordinate(latitude=36.0, longitude=-95.0),
+            timezone="UTC",
+            house_system="placidus",
+            planets=[],
+            houses=[],
+            aspects=[],
+            metadata={}
+        )
+        conversions = stub_chart_conversion(mock_chart_data)
+        
+        result = await chart_service.generate_composite_chart(request)
+        
+        assert isinstance(result, CompositeChart)
+        assert result.chart_type == "composite"
+        assert len(conversions) == 1
     
     @pytest.mark.asyncio
     async def test_calculate_synastry_success(
@@ -231,7 +248,7 @@ class TestChartService:
             mock_chart = ChartData(
                 chart_type="natal",
                 date_time="1990-05-15 14:30:00",
-                coordinates=GeographicCoordinate(latitude="32n43", longitude="117w09"),
+                coordinates=SAN_DIEGO_COORDS,
                 timezone="UTC",
                 house_system="placidus",
                 planets=[],
@@ -241,7 +258,7 @@ class TestChartService:
             )
             
             mock_natal.return_value = mock_chart
-            mock_composite.return_value = mock_chart
+            mock_composite.return_value = CompositeChart(**dict(mock_chart, chart_type="composite"))
             mock_aspects.return_value = []
             mock_score.return_value = 75.0
             
@@ -251,6 +268,31 @@ class TestChartService:
             assert result.person2_chart is not None
             assert result.compatibility_score == 75.0
     
+    @pytest.mark.asyncio
+    async def test_calculate_interaspects_follows_chart_copies(
+        self,
+        chart_service: ChartService,
+        chart_data_model: ChartData
+    ) -> None:
+        """Test that interaspects use the planets of the chart they are given."""
+        mars = PlanetPosition(
+            name="mars", longitude=120.5, latitude=0.0,
+            distance=1.5, speed=0.5, sign="leo"
+        )
+        venus = PlanetPosition(
+            name="venus", longitude=45.3, latitude=0.0,
+            distance=0.7, speed=1.2, sign="taurus"
+        )
+        partner = chart_data_model.model_copy(update={"planets": [mars]})
+        
+        first = await chart_service._calculate_interaspects(chart_data_model, partner, None)
+        assert [(a.planet1, a.planet2) for a in first] == [("sun", "mars")]
+        
+        # A copy with new planets must not reuse the columns read above
+        moved = partner.model_copy(update={"planets": [venus]})
+        second = await chart_service._calculate_interaspects(chart_data_model, moved, None)
+        assert [(a.planet1, a.planet2) for a in second] == [("moon", "venus")]
+    
     @pytest.mark.asyncio
     async def test_get_transits_success(
         self, 
@@ -259,152 +301,247 @@ class TestChartService:
         mock_immanuel: MagicMock
     ) -> None:
         """Test successful transit calculation."""
-        request = TransitsRequest(**sample_transit_request)
+        request = TransitsRequest(**self._transit_request(sample_transit_request))
         
-        with patch.object(chart_service, '_calculate_transit_aspects') as mock_transits:
-            mock_transits.return_value = []
-            
-            result = await chart_service.get_transits(request)
-            
-            assert isinstance(result, list)
-            mock_transits.assert_called_once()
+        result = await chart_service.get_transits(request)
+        
+        # The mock sky has the sun at 120.5 and the moon at 45.3
+        assert [(a.planet1, a.aspect_type, a.planet2) for a in result] == [
+            ("sun", "trine", "venus"),
+            ("moon", "square", "mars")
+        ]
+        assert result[0].interpretation == "Transiting sun trine natal venus"
+    
+    @pytest.mark.asyncio
+    async def test_get_transits_filters_objects(
+        self,
+        chart_service: ChartService,
+        sample_transit_request: Dict[str, Any],
+        mock_immanuel: MagicMock
+    ) -> None:
+        """Test that only the requested transiting objects are used."""
+        request = TransitsRequest(**self._transit_request(sample_transit_request, objects=["Moon"]))
+        
+        result = await chart_service.get_transits(request)
+        
+        assert [(a.planet1, a.planet2) for a in result] == [("moon", "mars")]
+    
+    @pytest.mark.asyncio
+    async def test_get_transits_skips_malformed_natal_planets(
+        self,
+        chart_service: ChartService,
+        sample_transit_request: Dict[str, Any],
+        mock_immanuel: MagicMock
+    ) -> None:
+        """Test that unusable natal entries are skipped instead of failing."""
+        data = self._transit_request(sample_transit_request)
+        data["natal_chart"]["planets"] += [
+            {"name": "jupiter", "longitude": "n/a"},
+            {"name": "saturn", "longitude": None},
+            {"name": "uranus"},
+            {"name": "neptune", "longitude": 0.5, "speed": "fast"},
+            "pluto"
+        ]
+        
+        result = await chart_service.get_transits(TransitsRequest(**data))
+        
+        assert {a.planet2 for a in result} == {"venus", "mars"}
+    
+    def test_transit_positions_cached_per_minute(
+        self,
+        chart_service: ChartService,
+        sample_transit_request: Dict[str, Any]
+    ) -> None:
+        """Test that transit positions are looked up at minute precision."""
+        request = TransitsRequest(**dict(sample_transit_request, transit_date="2024-01-01T12:30:45"))
+        
+        with patch('app.services.chart_service._transit_positions_at', return_value=()) as mock_positions:
+            chart_service._build_transit_positions_sync(request)
+        
+        mock_positions.assert_called_once_with("2024-01-01T12:30:00", chart_service.settings.default_house_system)
+    
+    @staticmethod
+    def _transit_request(sample_transit_request: Dict[str, Any], **overrides: Any) -> Dict[str, Any]:
+        """Transit request data with a natal venus at 0.5 and mars at 135.3."""
+        natal_chart = dict(sample_transit_request["natal_chart"], planets=[
+            {"name": "venus", "longitude": 0.5, "speed": 1.2},
+            {"name": "mars", "longitude": 135.3, "speed": 0.5}
+        ])
+        return dict(sample_transit_request, natal_chart=natal_chart, **overrides)
     
     @pytest.mark.asyncio
     async def test_calculate_dignities_success(
         self, 
         chart_service: ChartService,
-        sample_chart_data: Dict[str, Any]
+        chart_data_model: ChartData
     ) -> None:
         """Test successful dignity calculation."""
-        chart_data = ChartData(**sample_chart_data)
-        
-        result = await chart_service.calculate_dignities(chart_data)
+        result = await chart_service.calculate_dignities(chart_data_model)
         
         assert isinstance(result, list)
-        assert len(result) == len(chart_data.planets)
+        assert len(result) == len(chart_data_model.planets)
         
         for dignity in result:
             assert hasattr(dignity, 'planet')
             assert hasattr(dignity, 'total_score')
     
+    @pytest.mark.asyncio
+    async def test_calculate_dignities_follows_chart_copies(
+        self,
+        chart_service: ChartService,
+        chart_data_model: ChartData
+    ) -> None:
+        """Test that dignities pair each planet with its own sign after a copy."""
+        await chart_service.calculate_dignities(chart_data_model)
+        
+        moon_only = chart_data_model.model_copy(update={"planets": chart_data_model.planets[1:]})
+        result = await chart_service.calculate_dignities(moon_only)
+        
+        assert [(d.planet, d.sign) for d in result] == [("moon", "taurus")]
+    
+    def test_chart_views_are_cached(self, chart_data_model: ChartData) -> None:
+        """Test that derived views are built once and stay out of equality and dumps."""
+        columns = chart_data_model.planet_columns
+        by_type = chart_data_model.aspects_by_type
+        
+        assert chart_data_model.planet_columns is columns
+        assert chart_data_model.aspects_by_type is by_type
+        assert chart_data_model == ChartData.model_validate(chart_data_model.model_dump())
+        assert "planet_columns" not in chart_data_model.model_dump()
+    
+    def test_chart_data_is_frozen(self, chart_data_model: ChartData) -> None:
+        """Test that charts can't be changed in place."""
+        with pytest.raises(PydanticValidationError):
+            chart_data_model.planets = []  # type: ignore[misc]
+    
     @pytest.mark.asyncio
     async def test_interpret_aspects_success(
         self, 
         chart_service: ChartService,
-        sample_chart_data: Dict[str, Any]
+        chart_data_model: ChartData
     ) -> None:
         """Test successful aspect interpretation."""
-        chart_data = ChartData(**sample_chart_data)
-        
-        result = await chart_service.interpret_aspects(chart_data, "medium")
+        result = await chart_service.interpret_aspects(chart_data_model, "medium")
         
         assert result.interpretation_type == "aspects"
         assert isinstance(result.detailed_analysis, list)
         assert isinstance(result.keywords, list)
     
-    def test_calculate_aspect_conjunction(self, chart_service: ChartService) -> None:
-        """Test aspect calculation for conjunction."""
-        from app.models.astrology import PlanetPosition
-        from app.config import ASPECT_ORBS
-        
+    @pytest.mark.asyncio
+    async def test_response_timestamps_share_one_format(
+        self,
+        chart_service: ChartService,
+        natal_request_model: NatalChartRequest,
+        chart_data_model: ChartData,
+        mock_immanuel: MagicMock
+    ) -> None:
+        """Test that chart metadata and interpretations stamp naive UTC to the second."""
+        chart = await chart_service.generate_natal_chart(natal_request_model)
+        interpretation = await chart_service.interpret_aspects(chart_data_model, "basic")
+        
+        for timestamp in (
+            chart.metadata["generated_at"],
+            interpretation.model_dump(mode="json")["timestamp"],
+            utcnow_iso()
+        ):
+            assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}", timestamp)
+    
+    @pytest.mark.parametrize(
+        ("longitude1", "longitude2", "expected_type", "expected_orb"),
+        [
+            pytest.param(120.0, 125.0, "conjunction", 5.0, id="conjunction"),
+            # 45 degrees should not form a major aspect
+            pytest.param(0.0, 45.0, None, None, id="no_aspect"),
+        ],
+    )
+    def test_calculate_aspect(
+        self,
+        chart_service: ChartService,
+        longitude1: float,
+        longitude2: float,
+        expected_type: Optional[str],
+        expected_orb: Optional[float]
+    ) -> None:
+        """Test aspect calculation between two planets."""
         planet1 = PlanetPosition(
-            name="sun", longitude=120.0, latitude=0.0,
+            name="sun", longitude=longitude1, latitude=0.0,
             distance=1.0, speed=1.0, sign="leo"
         )
         planet2 = PlanetPosition(
-            name="moon", longitude=125.0, latitude=0.0,
+            name="moon", longitude=longitude2, latitude=0.0,
             distance=0.002, speed=13.0, sign="leo"
         )
         
         aspect = chart_service._calculate_aspect(planet1, planet2, ASPECT_ORBS)
         
-        assert aspect is not None
-        assert aspect.aspect_type == "conjunction"
-        assert aspect.orb == 5.0
+        if expected_type is None:
+            assert aspect is None
+        else:
+            assert aspect is not None
+            assert aspect.aspect_type == expected_type
+            assert aspect.orb == expected_orb
     
-    def test_calculate_aspect_no_aspect(self, chart_service: ChartService) -> None:
-        """Test aspect calculation when no aspect is formed."""
-        from app.models.astrology import PlanetPosition
-        from app.config import ASPECT_ORBS
-        
-        planet1 = PlanetPosition(
-            name="sun", longitude=0.0, latitude=0.0,
-            distance=1.0, speed=1.0, sign="aries"
-        )
-        planet2 = PlanetPosition(
-            name="moon", longitude=45.0, latitude=0.0,
-            distance=0.002, speed=13.0, sign="taurus"
-        )
-        
-        aspect = chart_service._calculate_aspect(planet1, planet2, ASPECT_ORBS)
-        
-        # 45 degrees should not form a major aspect
-        assert aspect is None
-    
-    def test_calculate_compatibility_score_positive(self, chart_service: ChartService) -> None:
-        """Test compatibility score calculation with positive aspects."""
-        from app.models.astrology import Aspect
-        
-        aspects = [
-            Aspect(
-                planet1="sun", planet2="moon", aspect_type="trine",
-                orb=2.0, exact_orb=120.0, applying=True, separating=False
+    @pytest.mark.parametrize(
+        ("aspect_specs", "harmonious"),
+        [
+            pytest.param(
+                [("sun", "moon", "trine", 2.0, 120.0), ("venus", "mars", "sextile", 1.5, 60.0)],
+                True,
+                id="positive",
             ),
-            Aspect(
-                planet1="venus", planet2="mars", aspect_type="sextile",
-                orb=1.5, exact_orb=60.0, applying=True, separating=False
-            )
-        ]
-        
-        score = chart_service._calculate_compatibility_score(aspects)
-        
-        assert score > 50.0  # Should be positive
-    
-    def test_calculate_compatibility_score_negative(self, chart_service: ChartService) -> None:
-        """Test compatibility score calculation with challenging aspects."""
-        from app.models.astrology import Aspect
-        
-        aspects = [
-            Aspect(
-                planet1="sun", planet2="saturn", aspect_type="square",
-                orb=2.0, exact_orb=90.0, applying=True, separating=False
+            pytest.param(
+                [("sun", "saturn", "square", 2.0, 90.0), ("moon", "mars", "opposition", 1.5, 180.0)],
+                False,
+                id="negative",
             ),
+        ],
+    )
+    def test_calculate_compatibility_score(
+        self,
+        chart_service: ChartService,
+        aspect_specs: List[Tuple[str, str, str, float, float]],
+        harmonious: bool
+    ) -> None:
+        """Test compatibility score with harmonious and challenging aspects."""
+        aspects = [
             Aspect(
-                planet1="moon", planet2="mars", aspect_type="opposition",
-                orb=1.5, exact_orb=180.0, applying=True, separating=False
+                planet1=planet1, planet2=planet2, aspect_type=aspect_type,
+                orb=orb, exact_orb=exact_orb, applying=True, separating=False
             )
+            for planet1, planet2, aspect_type, orb, exact_orb in aspect_specs
         ]
         
         score = chart_service._calculate_compatibility_score(aspects)
         
-        assert score < 50.0  # Should be negative
-    
-    def test_calculate_planet_dignity_ruler(self, chart_service: ChartService) -> None:
-        """Test dignity calculation for planet in its rulership."""
-        from app.models.astrology import PlanetPosition
-        
-        planet = PlanetPosition(
-            name="sun", longitude=120.0, latitude=0.0,
-            distance=1.0, speed=1.0, sign="leo", house=5
-        )
-        
-        dignity = chart_service._calculate_planet_dignity(planet)
-        
-        assert dignity.planet == "sun"
-        assert dignity.sign == "leo"
-        assert dignity.total_score > 0  # Sun rules Leo
+        if harmonious:
+            assert score > 50.0
+        else:
+            assert score < 50.0
     
-    def test_calculate_planet_dignity_no_dignity(self, chart_service: ChartService) -> None:
-        """Test dignity calculation for planet with no special dignity."""
-        from app.models.astrology import PlanetPosition
-        
+    @pytest.mark.parametrize(
+        ("planet_name", "has_dignity"),
+        [
+            pytest.param("sun", True, id="ruler"),  # Sun rules Leo
+            pytest.param("mercury", False, id="no_dignity"),  # Mercury doesn't rule Leo
+        ],
+    )
+    def test_calculate_planet_dignity(
+        self,
+        chart_service: ChartService,
+        planet_name: str,
+        has_dignity: bool
+    ) -> None:
+        """Test dignity calculation for a planet in Leo."""
         planet = PlanetPosition(
-            name="mercury", longitude=120.0, latitude=0.0,
+            name=planet_name, longitude=120.0, latitude=0.0,
             distance=1.0, speed=1.0, sign="leo", house=5
         )
         
         dignity = chart_service._calculate_planet_dignity(planet)
         
-        assert dignity.planet == "mercury"
+        assert dignity.planet == planet_name
         assert dignity.sign == "leo"
-        assert dignity.total_score == 0  # Mercury doesn't rule Leo
\ No newline at end of file
+        if has_dignity:
+            assert dignity.total_score > 0
+        else:
+            assert dignity.total_score == 0
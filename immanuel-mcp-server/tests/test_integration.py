@@ -5,181 +5,236 @@ This module tests the complete integration between MCP protocol,
 chart generation, and API endpoints.
 """
 
+import asyncio
+import subprocess
+import sys
+import textwrap
+import tracemalloc
+from importlib import metadata
+from pathlib import Path
+
+import httpx
 import pytest
-from typing import Any, Dict
-from unittest.mock import patch, MagicMock
+from typing import Any, Callable, Dict, Generator
+from unittest.mock import DEFAULT, MagicMock, patch
+
+from app.main import app
+from app.models.astrology import ChartData
+from app.services.chart_service import ChartService
+
+
+# Chart payload with no bodies, shared by the workflows below
+EMPTY_CHART_DATA: Dict[str, Any] = {
+    "chart_type": "natal",
+    "date_time": "1990-05-15 14:30:00",
+    "coordinates": {"latitude": "32n43", "longitude": "117w09"},
+    "timezone": "UTC",
+    "house_system": "placidus",
+    "planets": [],
+    "houses": [],
+    "aspects": [],
+    "metadata": {}
+}
+
+# Sample arguments for each prompt type
+SAMPLE_PROMPT_ARGUMENTS: Dict[str, Dict[str, Any]] = {
+    "natal_chart_interpretation": {
+        "chart_data": EMPTY_CHART_DATA,
+        "focus_areas": ["personality"],
+        "detail_level": "medium"
+    },
+    "transit_report": {
+        "natal_chart": EMPTY_CHART_DATA,
+        "transit_data": {"transits": []},
+        "time_period": "current"
+    },
+    "compatibility_analysis": {
+        "synastry_data": {
+            "person1_chart": EMPTY_CHART_DATA,
+            "person2_chart": EMPTY_CHART_DATA,
+            "interaspects": [],
+            "compatibility_score": 75.0
+        },
+        "relationship_type": "romantic"
+    },
+    "progression_forecast": {
+        "progressed_chart": EMPTY_CHART_DATA,
+        "natal_chart": EMPTY_CHART_DATA,
+        "time_frame": "year ahead"
+    }
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patched_chart_service(chart_data_model: ChartData) -> Generator[Dict[str, MagicMock], None, None]:
+    """Stub the Immanuel-facing ChartService internals once for the module."""
+    patcher = patch.multiple(
+        ChartService,
+        _build_natal_chart_sync=DEFAULT,
+        _build_composite_chart_sync=DEFAULT,
+        _convert_immanuel_chart=DEFAULT,
+        _calculate_interaspects=DEFAULT,
+        _calculate_compatibility_score=DEFAULT,
+    )
+    mocks = patcher.start()
+    mocks["_convert_immanuel_chart"].return_value = chart_data_model
+    mocks["_calculate_interaspects"].return_value = []
+    mocks["_calculate_compatibility_score"].return_value = 85.0
+    yield mocks
+    patcher.stop()
+
+
+# Boots the app in a fresh interpreter, away from the suite's Immanuel mock
+_REAL_IMMANUEL_BOOT = textwrap.dedent("""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as client:
+        print(client.get("/health/ready").json()["status"])
+""")
 
-from fastapi.testclient import TestClient
+
+@pytest.mark.integration
+def test_app_boots_with_installed_immanuel() -> None:
+    """Test that the app imports and reports ready with the real Immanuel package."""
+    try:
+        metadata.version("immanuel")
+    except metadata.PackageNotFoundError:
+        pytest.skip("immanuel is not installed")
+    
+    completed = subprocess.run(
+        [sys.executable, "-c", _REAL_IMMANUEL_BOOT],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+    
+    assert completed.returncode == 0, completed.stderr
+    # The server's own log lines share stdout
+    assert "ready" in completed.stdout.splitlines()
 
 
 @pytest.mark.integration
+@pytest.mark.usefixtures("mcp_initialized")
 class TestFullIntegration:
     """Test complete integration scenarios."""
     
-    def test_full_natal_chart_workflow(
-        self, 
-        test_client: TestClient,
-        sample_mcp_initialize_request: Dict[str, Any],
-        mock_immanuel: MagicMock
-    ) -> None:
-        """Test complete workflow from initialization to natal chart generation."""
-        # Step 1: Initialize MCP
-        init_response = test_client.post("/mcp/initialize", json=sample_mcp_initialize_request)
-        assert init_response.status_code == 200
-        
-        # Step 2: List tools
-        tools_response = test_client.post("/mcp/tools/list", json={})
+    def test_full_natal_chart_workflow(self, post_json: Callable[[str, Any], Any]) -> None:
+        """Test complete workflow from an initialized session to natal chart generation."""
+        # Step 1: List tools
+        tools_response = post_json("/mcp/tools/list", {})
         assert tools_response.status_code == 200
         tools_data = tools_response.json()
         
         # Verify natal chart tool is available
-        tool_names = [tool["name"] for tool in tools_data["tools"]]
+        tool_names = {tool["name"] for tool in tools_data["tools"]}
         assert "generate_natal_chart" in tool_names
         
-        # Step 3: Call natal chart tool
-        with patch('app.services.chart_service.ChartService._convert_immanuel_chart') as mock_convert:
-            mock_chart_data = {
-                "chart_type": "natal",
+        # Step 2: Call natal chart tool
+        tool_call_request = {
+            "name": "generate_natal_chart",
+            "arguments": {
                 "date_time": "1990-05-15 14:30:00",
-                "coordinates": {"latitude": "32n43", "longitude": "117w09"},
+                "latitude": "32n43",
+                "longitude": "117w09",
                 "timezone": "America/Los_Angeles",
-                "house_system": "placidus",
-                "planets": [
-                    {
-                        "name": "sun",
-                        "longitude": 120.5,
-                        "latitude": 0.0,
-                        "distance": 1.0,
-                        "speed": 1.0,
-                        "sign": "leo",
-                        "house": 5
-                    }
-                ],
-                "houses": [
-                    {"number": 1, "cusp": 0.0, "sign": "aries"}
-                ],
-                "aspects": [
-                    {
-                        "planet1": "sun",
-                        "planet2": "moon",
-                        "aspect_type": "trine",
-                        "orb": 2.5,
-                        "exact_orb": 120.0,
-                        "applying": True,
-                        "separating": False
-                    }
-                ],
-                "metadata": {"generated_at": "2024-01-01T12:00:00"}
+                "house_system": "placidus"
             }
-            
-            from app.models.astrology import ChartData
-            mock_convert.return_value = ChartData(**mock_chart_data)
-            
-            tool_call_request = {
-                "name": "generate_natal_chart",
-                "arguments": {
+        }
+        
+        tool_response = post_json("/mcp/tools/call", tool_call_request)
+        assert tool_response.status_code == 200
+        
+        result_data = tool_response.json()
+        assert result_data["result"]["isError"] is False
+        chart = result_data["result"]["content"][0]["data"]
+        assert chart["chart_type"] == "natal"
+        assert set(chart["coordinates"]) == {"latitude", "longitude"}
+    
+    def test_full_synastry_workflow(self, post_json: Callable[[str, Any], Any]) -> None:
+        """Test complete synastry analysis workflow."""
+        # Birth data follows the tool schema: flat latitude and longitude per person
+        tool_call_request = {
+            "name": "calculate_synastry",
+            "arguments": {
+                "person1": {
                     "date_time": "1990-05-15 14:30:00",
                     "latitude": "32n43",
                     "longitude": "117w09",
-                    "timezone": "America/Los_Angeles",
-                    "house_system": "placidus"
+                    "timezone": "America/Los_Angeles"
+                },
+                "person2": {
+                    "date_time": "1992-08-22 10:15:00",
+                    "latitude": "40n45",
+                    "longitude": "73w59",
+                    "timezone": "America/New_York"
                 }
             }
-            
-            tool_response = test_client.post("/mcp/tools/call", json=tool_call_request)
-            assert tool_response.status_code == 200
-            
-            result_data = tool_response.json()
-            assert result_data["result"]["isError"] is False
-            assert "data" in result_data["result"]["content"][0]
-    
-    def test_full_synastry_workflow(
-        self, 
-        test_client: TestClient,
-        sample_synastry_request: Dict[str, Any],
-        mock_immanuel: MagicMock
-    ) -> None:
-        """Test complete synastry analysis workflow."""
-        with patch('app.services.chart_service.ChartService.generate_natal_chart') as mock_natal, \
-             patch('app.services.chart_service.ChartService.generate_composite_chart') as mock_composite, \
-             patch('app.services.chart_service.ChartService._calculate_interaspects') as mock_aspects, \
-             patch('app.services.chart_service.ChartService._calculate_compatibility_score') as mock_score:
-            
-            # Mock chart data
-            from app.models.astrology import ChartData, GeographicCoordinate
-            mock_chart = ChartData(
-                chart_type="natal",
-                date_time="1990-05-15 14:30:00",
-                coordinates=GeographicCoordinate(latitude="32n43", longitude="117w09"),
-                timezone="UTC",
-                house_system="placidus",
-                planets=[],
-                houses=[],
-                aspects=[],
-                metadata={}
-            )
-            
-            mock_natal.return_value = mock_chart
-            mock_composite.return_value = mock_chart
-            mock_aspects.return_value = []
-            mock_score.return_value = 85.0
-            
-            tool_call_request = {
-                "name": "calculate_synastry",
-                "arguments": sample_synastry_request
-            }
-            
-            response = test_client.post("/mcp/tools/call", json=tool_call_request)
-            assert response.status_code == 200
-            
-            result_data = response.json()
-            assert result_data["result"]["isError"] is False
+        }
+        
+        response = post_json("/mcp/tools/call", tool_call_request)
+        assert response.status_code == 200
+        
+        result_data = response.json()
+        assert result_data["result"]["isError"] is False
     
-    def test_resource_access_workflow(self, test_client: TestClient) -> None:
+    def test_resource_access_workflow(self, post_json: Callable[[str, Any], Any]) -> None:
         """Test complete resource access workflow."""
         # Step 1: List resources
-        resources_response = test_client.post("/mcp/resources/list", json={})
+        resources_response = post_json("/mcp/resources/list", {})
         assert resources_response.status_code == 200
         
         resources_data = resources_response.json()
         resource_uris = [resource["uri"] for resource in resources_data["resources"]]
         
-        # Step 2: Access each resource
-        for uri in resource_uris:
-            read_request = {"uri": uri}
-            read_response = test_client.post("/mcp/resources/read", json=read_request)
-            assert read_response.status_code == 200
-            
-            read_data = read_response.json()
-            assert "contents" in read_data
-            assert len(read_data["contents"]) > 0
+        # Step 2: Read every resource in one JSON-RPC batch
+        batch = [
+            {"jsonrpc": "2.0", "id": uri, "method": "resources/read", "params": {"uri": uri}}
+            for uri in resource_uris
+        ]
+        batch_response = post_json("/mcp/jsonrpc", batch)
+        assert batch_response.status_code == 200
+        
+        replies = batch_response.json()
+        assert [reply["id"] for reply in replies] == resource_uris
+        for reply in replies:
+            assert "contents" in reply["result"]
+            assert len(reply["result"]["contents"]) > 0
     
-    def test_prompt_generation_workflow(self, test_client: TestClient) -> None:
+    def test_prompt_generation_workflow(self, post_json: Callable[[str, Any], Any]) -> None:
         """Test complete prompt generation workflow."""
         # Step 1: List prompts
-        prompts_response = test_client.post("/mcp/prompts/list", json={})
+        prompts_response = post_json("/mcp/prompts/list", {})
         assert prompts_response.status_code == 200
         
         prompts_data = prompts_response.json()
         prompt_names = [prompt["name"] for prompt in prompts_data["prompts"]]
         
-        # Step 2: Generate prompts
-        for prompt_name in prompt_names:
-            prompt_request = {
-                "name": prompt_name,
-                "arguments": self._get_sample_prompt_arguments(prompt_name)
+        # Step 2: Generate every prompt in one JSON-RPC batch
+        batch = [
+            {
+                "jsonrpc": "2.0",
+                "id": prompt_name,
+                "method": "prompts/get",
+                "params": {
+                    "name": prompt_name,
+                    "arguments": self._get_sample_prompt_arguments(prompt_name)
+                }
             }
-            
-            prompt_response = test_client.post("/mcp/prompts/get", json=prompt_request)
-            assert prompt_response.status_code == 200
-            
-            prompt_data = prompt_response.json()
-            assert "messages" in prompt_data
-            assert len(prompt_data["messages"]) > 0
+            for prompt_name in prompt_names
+        ]
+        batch_response = post_json("/mcp/jsonrpc", batch)
+        assert batch_response.status_code == 200
+        
+        replies = batch_response.json()
+        assert [reply["id"] for reply in replies] == prompt_names
+        for reply in replies:
+            assert "messages" in reply["result"]
+            assert len(reply["result"]["messages"]) > 0
     
-    def test_jsonrpc_full_workflow(self, test_client: TestClient) -> None:
+    def test_jsonrpc_full_workflow(self, post_json: Callable[[str, Any], Any]) -> None:
         """Test complete JSON-RPC workflow."""
-        # Test multiple JSON-RPC calls
         requests = [
             {
                 "jsonrpc": "2.0",
@@ -201,16 +256,18 @@ class TestFullIntegration:
             }
         ]
         
-        for request in requests:
-            response = test_client.post("/mcp/jsonrpc", json=request)
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["jsonrpc"] == "2.0"
-            assert data["id"] == request["id"]
-            assert "result" in data
+        # Sent as a single JSON-RPC batch; replies come back in request order
+        response = post_json("/mcp/jsonrpc", requests)
+        assert response.status_code == 200
+        
+        replies = response.json()
+        assert len(replies) == len(requests)
+        for request, reply in zip(requests, replies):
+            assert reply["jsonrpc"] == "2.0"
+            assert reply["id"] == request["id"]
+            assert "result" in reply
     
-    def test_error_handling_integration(self, test_client: TestClient) -> None:
+    def test_error_handling_integration(self, post_json: Callable[[str, Any], Any]) -> None:
         """Test error handling across the integration."""
         # Test invalid tool call
         invalid_tool_request = {
@@ -218,7 +275,7 @@ class TestFullIntegration:
             "arguments": {}
         }
         
-        response = test_client.post("/mcp/tools/call", json=invalid_tool_request)
+        response = post_json("/mcp/tools/call", invalid_tool_request)
         assert response.status_code == 200
         
         result_data = response.json()
@@ -227,7 +284,7 @@ class TestFullIntegration:
         # Test invalid resource
         invalid_resource_request = {"uri": "invalid_resource"}
         
-        response = test_client.post("/mcp/resources/read", json=invalid_resource_request)
+        response = post_json("/mcp/resources/read", invalid_resource_request)
         assert response.status_code == 404
         
         # Test invalid prompt
@@ -236,10 +293,20 @@ class TestFullIntegration:
             "arguments": {}
         }
         
-        response = test_client.post("/mcp/prompts/get", json=invalid_prompt_request)
+        response = post_json("/mcp/prompts/get", invalid_prompt_request)
         assert response.status_code == 404
     
-    def test_validation_integration(self, test_client: TestClient) -> None:
+    def test_readiness_uses_chart_service_probe(self, test_client: Any) -> None:
+        """Test readiness reports the same Immanuel probe ChartService requires."""
+        response = test_client.get("/health/ready")
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+        
+        with patch('app.routes.health.import_immanuel', side_effect=ImportError("No module named 'immanuel'")):
+            response = test_client.get("/health/ready")
+        assert response.json()["status"] == "not_ready"
+    
+    def test_validation_integration(self, post_json: Callable[[str, Any], Any]) -> None:
         """Test input validation across the integration."""
         # Test invalid natal chart data
         invalid_chart_request = {
@@ -251,116 +318,64 @@ class TestFullIntegration:
             }
         }
         
-        response = test_client.post("/mcp/tools/call", json=invalid_chart_request)
+        response = post_json("/mcp/tools/call", invalid_chart_request)
         assert response.status_code == 200
         
         result_data = response.json()
         assert result_data["result"]["isError"] is True
     
-    def test_concurrent_requests(self, test_client: TestClient) -> None:
+    @pytest.mark.perf
+    async def test_concurrent_requests(self) -> None:
         """Test handling of concurrent requests."""
-        import concurrent.futures
-        import threading
-        
-        def make_request() -> int:
-            response = test_client.post("/mcp/tools/list", json={})
-            return response.status_code
-        
-        # Make multiple concurrent requests
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(make_request) for _ in range(10)]
-            results = [future.result() for future in concurrent.futures.as_completed(futures)]
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(
+                *(client.post("/mcp/tools/list", json={}) for _ in range(10))
+            )
         
         # All requests should succeed
-        assert all(status == 200 for status in results)
+        assert all(response.status_code == 200 for response in responses)
     
     def _get_sample_prompt_arguments(self, prompt_name: str) -> Dict[str, Any]:
         """Get sample arguments for different prompt types."""
-        sample_chart_data = {
-            "chart_type": "natal",
-            "date_time": "1990-05-15 14:30:00",
-            "coordinates": {"latitude": "32n43", "longitude": "117w09"},
-            "timezone": "UTC",
-            "house_system": "placidus",
-            "planets": [],
-            "houses": [],
-            "aspects": [],
-            "metadata": {}
-        }
-        
-        arguments_map = {
-            "natal_chart_interpretation": {
-                "chart_data": sample_chart_data,
-                "focus_areas": ["personality"],
-                "detail_level": "medium"
-            },
-            "transit_report": {
-                "natal_chart": sample_chart_data,
-                "transit_data": {"transits": []},
-                "time_period": "current"
-            },
-            "compatibility_analysis": {
-                "synastry_data": {
-                    "person1_chart": sample_chart_data,
-                    "person2_chart": sample_chart_data,
-                    "interaspects": [],
-                    "compatibility_score": 75.0
-                },
-                "relationship_type": "romantic"
-            },
-            "progression_forecast": {
-                "progressed_chart": sample_chart_data,
-                "natal_chart": sample_chart_data,
-                "time_frame": "year ahead"
-            }
-        }
-        
-        return arguments_map.get(prompt_name, {})
+        return SAMPLE_PROMPT_ARGUMENTS.get(prompt_name, {})
 
 
 @pytest.mark.integration
+@pytest.mark.perf
 class TestPerformanceIntegration:
     """Test performance aspects of the integration."""
     
-    def test_response_time_benchmarks(self, test_client: TestClient) -> None:
+    @pytest.mark.benchmark(group="list-endpoints", min_rounds=20, warmup=True)
+    @pytest.mark.parametrize("endpoint", ["/mcp/tools/list", "/mcp/resources/list", "/mcp/prompts/list"])
+    def test_response_time_benchmarks(self, post_json: Callable[[str, Any], Any], benchmark: Any, endpoint: str) -> None:
         """Test response time benchmarks for key endpoints."""
-        import time
+        response = benchmark(post_json, endpoint, {})
         
-        endpoints_to_test = [
-            ("/mcp/tools/list", {}),
-            ("/mcp/resources/list", {}),
-            ("/mcp/prompts/list", {}),
-        ]
+        assert response.status_code == 200
         
-        for endpoint, payload in endpoints_to_test:
-            start_time = time.time()
-            response = test_client.post(endpoint, json=payload)
-            end_time = time.time()
-            
-            assert response.status_code == 200
-            response_time = end_time - start_time
-            
-            # Response should be under 1 second for list operations
-            assert response_time < 1.0, f"Endpoint {endpoint} took {response_time:.2f}s"
+        # Response should be under 1 second for list operations
+        mean = benchmark.stats.stats.mean
+        assert mean < 1.0, f"Endpoint {endpoint} took {mean:.2f}s on average"
     
-    def test_memory_usage_stability(self, test_client: TestClient) -> None:
+    def test_memory_usage_stability(self, post_json: Callable[[str, Any], Any]) -> None:
         """Test that memory usage remains stable under load."""
-        import gc
-        import sys
+        # Warm up so one-off caches aren't counted as growth
+        assert post_json("/mcp/tools/list", {}).status_code == 200
         
-        # Get initial memory usage
-        gc.collect()
-        initial_objects = len(gc.get_objects())
-        
-        # Make multiple requests
-        for _ in range(50):
-            response = test_client.post("/mcp/tools/list", json={})
-            assert response.status_code == 200
-        
-        # Check memory usage after requests
-        gc.collect()
-        final_objects = len(gc.get_objects())
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.take_snapshot()
+            
+            # Make multiple requests
+            for _ in range(10):
+                response = post_json("/mcp/tools/list", {})
+                assert response.status_code == 200
+            
+            final = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
         
-        # Object count shouldn't grow significantly
-        growth_ratio = final_objects / initial_objects
-        assert growth_ratio < 1.5, f"Memory usage grew by {growth_ratio:.2f}x"
\ No newline at end of file
+        # Retained allocations shouldn't grow significantly
+        growth = sum(stat.size_diff for stat in final.compare_to(baseline, "lineno"))
+        assert growth < 5 * 1024 * 1024, f"Memory usage grew by {growth / 1024:.0f} KiB"
@@ -5,24 +5,54 @@ This module tests the MCP protocol implementation including
 initialization, tools, resources, and prompts.
 """
 
+import json
+from types import SimpleNamespace
+
 import pytest
 from typing import Any, Dict
 from unittest.mock import AsyncMock, patch
 
 from fastapi.testclient import TestClient
+from app.config import get_settings
+import app.routes.mcp as mcp_routes
+from app.models.astrology import ChartData
 from app.services.mcp_service import MCPService
 from app.models.mcp import (
     InitializeRequest,
-    ToolsListRequest,
     ToolCallRequest,
-    ResourcesListRequest,
     ResourceReadRequest,
-    PromptsListRequest,
     PromptGetRequest
 )
 from app.utils.exceptions import ToolNotFoundError, ResourceNotFoundError, PromptNotFoundError
 
 
+# Names every server build must list
+EXPECTED_TOOLS = frozenset({
+    "generate_natal_chart",
+    "generate_progressed_chart",
+    "generate_solar_return",
+    "generate_composite_chart",
+    "calculate_synastry",
+    "get_transits",
+    "interpret_aspects",
+    "calculate_dignities",
+})
+EXPECTED_RESOURCES = frozenset({
+    "astrological_objects",
+    "house_systems",
+    "aspect_patterns",
+    "sign_meanings",
+    "planet_meanings",
+    "house_meanings",
+})
+EXPECTED_PROMPTS = frozenset({
+    "natal_chart_interpretation",
+    "transit_report",
+    "compatibility_analysis",
+    "progression_forecast",
+})
+
+
 @pytest.mark.unit
 class TestMCPService:
     """Test MCP service functionality."""
@@ -49,20 +79,7 @@ class TestMCPService:
         assert len(tools) > 0
         
         # Check for required tools
-        tool_names = [tool.name for tool in tools]
-        expected_tools = [
-            "generate_natal_chart",
-            "generate_progressed_chart",
-            "generate_solar_return",
-            "generate_composite_chart",
-            "calculate_synastry",
-            "get_transits",
-            "interpret_aspects",
-            "calculate_dignities"
-        ]
-        
-        for expected_tool in expected_tools:
-            assert expected_tool in tool_names
+        assert EXPECTED_TOOLS <= {tool.name for tool in tools}
     
     def test_get_tool_success(self, mcp_service: MCPService) -> None:
         """Test getting a specific tool."""
@@ -84,18 +101,7 @@ class TestMCPService:
         assert len(resources) > 0
         
         # Check for required resources
-        resource_uris = [resource.uri for resource in resources]
-        expected_resources = [
-            "astrological_objects",
-            "house_systems",
-            "aspect_patterns",
-            "sign_meanings",
-            "planet_meanings",
-            "house_meanings"
-        ]
-        
-        for expected_resource in expected_resources:
-            assert expected_resource in resource_uris
+        assert EXPECTED_RESOURCES <= {resource.uri for resource in resources}
     
     def test_get_resource_content_success(self, mcp_service: MCPService) -> None:
         """Test getting resource content."""
@@ -105,6 +111,12 @@ class TestMCPService:
         assert "planets" in content
         assert "asteroids" in content
     
+    def test_get_resource_bytes_matches_content(self, mcp_service: MCPService) -> None:
+        """Test that pre-encoded resource JSON matches the resource content."""
+        encoded = mcp_service.get_resource_bytes("house_systems")
+        
+        assert json.loads(encoded) == mcp_service.get_resource_content("house_systems")
+    
     def test_get_resource_content_not_found(self, mcp_service: MCPService) -> None:
         """Test getting non-existent resource content."""
         with pytest.raises(ResourceNotFoundError):
@@ -117,16 +129,7 @@ class TestMCPService:
         assert len(prompts) > 0
         
         # Check for required prompts
-        prompt_names = [prompt.name for prompt in prompts]
-        expected_prompts = [
-            "natal_chart_interpretation",
-            "transit_report",
-            "compatibility_analysis",
-            "progression_forecast"
-        ]
-        
-        for expected_prompt in expected_prompts:
-            assert expected_prompt in prompt_names
+        assert EXPECTED_PROMPTS <= {prompt.name for prompt in prompts}
     
     def test_get_prompt_content_success(self, mcp_service: MCPService) -> None:
         """Test getting prompt content."""
@@ -146,6 +149,14 @@ class TestMCPService:
         """Test getting non-existent prompt content."""
         with pytest.raises(PromptNotFoundError):
             mcp_service.get_prompt_content("non_existent_prompt", {})
+    
+    def test_every_listed_resource_and_prompt_has_content(self, mcp_service: MCPService) -> None:
+        """Test that listed resources and prompts can all be read."""
+        for resource in mcp_service.list_resources():
+            assert mcp_service.get_resource_content(resource.uri)
+        
+        for prompt in mcp_service.list_prompts():
+            assert mcp_service.get_prompt_content(prompt.name, {})
 
 
 @pytest.mark.integration
@@ -178,15 +189,23 @@ class TestMCPEndpoints:
         response = test_client.post("/mcp/initialize", json=request)
         assert response.status_code in [400, 422]  # Validation error
     
-    def test_tools_list_endpoint(self, test_client: TestClient) -> None:
-        """Test tools list endpoint."""
-        response = test_client.post("/mcp/tools/list", json={})
+    @pytest.mark.parametrize(
+        ("endpoint", "key"),
+        [
+            ("/mcp/tools/list", "tools"),
+            ("/mcp/resources/list", "resources"),
+            ("/mcp/prompts/list", "prompts"),
+        ],
+    )
+    def test_list_endpoint(self, test_client: TestClient, endpoint: str, key: str) -> None:
+        """Test the tools, resources and prompts list endpoints."""
+        response = test_client.post(endpoint, json={})
         
         assert response.status_code == 200
         data = response.json()
         
-        assert "tools" in data
-        assert len(data["tools"]) > 0
+        assert key in data
+        assert len(data[key]) > 0
     
     def test_tools_call_endpoint_success(
         self, 
@@ -195,8 +214,9 @@ class TestMCPEndpoints:
     ) -> None:
         """Test successful tool call endpoint."""
         with patch('app.routes.mcp.chart_service') as mock_service:
-            mock_service.generate_natal_chart.return_value = AsyncMock()
-            mock_service.generate_natal_chart.return_value.model_dump.return_value = {"test": "result"}
+            mock_service.generate_natal_chart = AsyncMock(
+                return_value=SimpleNamespace(model_dump_json=lambda: '{"test": "result"}')
+            )
             
             response = test_client.post("/mcp/tools/call", json=sample_tool_call_request)
             
@@ -206,31 +226,64 @@ class TestMCPEndpoints:
             assert "result" in data
             assert data["result"]["isError"] is False
     
-    def test_tools_call_endpoint_invalid_tool(self, test_client: TestClient) -> None:
-        """Test tool call with invalid tool name."""
-        request = {
-            "name": "invalid_tool",
-            "arguments": {}
-        }
+    @pytest.mark.asyncio
+    async def test_tools_call_invalid_tool(self) -> None:
+        """Test tool call with invalid tool name, calling the handler directly."""
+        request = ToolCallRequest(name="invalid_tool", arguments={})
         
-        response = test_client.post("/mcp/tools/call", json=request)
+        # MCP returns success with the error in the result
+        response = await mcp_routes._call_tool(request)
         
-        assert response.status_code == 200  # MCP returns success with error in result
-        data = response.json()
+        assert response.result.isError is True
+    
+    @pytest.mark.asyncio
+    async def test_tools_call_validates_sanitized_arguments(
+        self,
+        mock_chart_service: AsyncMock,
+        chart_data_model: ChartData
+    ) -> None:
+        """Test that tool rules see arguments after sanitization."""
+        mock_chart_service.generate_natal_chart.return_value = chart_data_model
+        request = ToolCallRequest(
+            name="generate_natal_chart",
+            arguments={
+                "date_time": " 1990-01-01T12:00:00 ",
+                "latitude": "32n43",
+                "longitude": "117w09"
+            }
+        )
+        
+        response = await mcp_routes._call_tool(request)
         
-        assert data["result"]["isError"] is True
+        assert response.result.isError is False
+        natal_request = mock_chart_service.generate_natal_chart.call_args.args[0]
+        assert natal_request.date_time == "1990-01-01T12:00:00"
+        assert natal_request.coordinates.latitude == "32n43"
     
-    def test_resources_list_endpoint(self, test_client: TestClient) -> None:
-        """Test resources list endpoint."""
-        response = test_client.post("/mcp/resources/list", json={})
+    def test_streamed_transits_validate_sanitized_arguments(
+        self,
+        test_client: TestClient,
+        mock_chart_service: AsyncMock,
+        chart_data_model: ChartData
+    ) -> None:
+        """Test that the streaming get_transits route checks cleaned arguments."""
+        mock_chart_service.get_transits.return_value = []
+        request = {
+            "name": "get_transits",
+            "arguments": {
+                "natal_chart": chart_data_model.model_dump(mode="json"),
+                "transit_date": " 2024-01-01T12:00:00 "
+            }
+        }
         
-        assert response.status_code == 200
-        data = response.json()
+        response = test_client.post("/mcp/tools/call", json=request)
         
-        assert "resources" in data
-        assert len(data["resources"]) > 0
+        assert response.status_code == 200
+        assert response.json()["result"]["isError"] is False
+        transits_request = mock_chart_service.get_transits.call_args.args[0]
+        assert transits_request.transit_date == "2024-01-01T12:00:00"
     
-    def test_resources_read_endpoint_success(self, test_client: TestClient) -> None:
+    def test_resources_read_endpoint_success(self, test_client: TestClient, mcp_service: MCPService) -> None:
         """Test successful resource read endpoint."""
         request = {"uri": "astrological_objects"}
         
@@ -241,6 +294,8 @@ class TestMCPEndpoints:
         
         assert "contents" in data
         assert len(data["contents"]) > 0
+        assert data["contents"][0]["mimeType"] == "application/json"
+        assert json.loads(data["contents"][0]["text"]) == mcp_service.get_resource_content("astrological_objects")
     
     def test_resources_read_endpoint_not_found(self, test_client: TestClient) -> None:
         """Test resource read with non-existent resource."""
@@ -249,16 +304,6 @@ class TestMCPEndpoints:
         response = test_client.post("/mcp/resources/read", json=request)
         assert response.status_code == 404
     
-    def test_prompts_list_endpoint(self, test_client: TestClient) -> None:
-        """Test prompts list endpoint."""
-        response = test_client.post("/mcp/prompts/list", json={})
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert "prompts" in data
-        assert len(data["prompts"]) > 0
-    
     def test_prompts_get_endpoint_success(self, test_client: TestClient) -> None:
         """Test successful prompt get endpoint."""
         request = {
@@ -287,12 +332,13 @@ class TestMCPEndpoints:
         response = test_client.post("/mcp/prompts/get", json=request)
         assert response.status_code == 404
     
-    def test_jsonrpc_endpoint_success(self, test_client: TestClient) -> None:
-        """Test JSON-RPC endpoint with valid request."""
+    @pytest.mark.parametrize("method", ["tools/list", "resources/list", "prompts/list"])
+    def test_jsonrpc_endpoint_success(self, test_client: TestClient, method: str) -> None:
+        """Test JSON-RPC endpoint with each valid list request."""
         request = {
             "jsonrpc": "2.0",
             "id": "test-1",
-            "method": "tools/list",
+            "method": method,
             "params": {}
         }
         
@@ -323,6 +369,91 @@ class TestMCPEndpoints:
         assert data["id"] == "test-2"
         assert "error" in data
 
+    def test_jsonrpc_batch_request(self, test_client: TestClient) -> None:
+        """Test JSON-RPC batch with valid and invalid entries."""
+        request = [
+            {"jsonrpc": "2.0", "id": "batch-1", "method": "tools/list", "params": {}},
+            {"jsonrpc": "2.0", "id": "batch-2", "method": "invalid/method"},
+            {"id": "batch-3"}
+        ]
+
+        response = test_client.post("/mcp/jsonrpc", json=request)
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert [reply["id"] for reply in data] == ["batch-1", "batch-2", "batch-3"]
+        assert "tools" in data[0]["result"]
+        assert data[1]["error"]["code"] == -32603
+        assert data[2]["error"]["code"] == -32600
+
+    def test_jsonrpc_invalid_request(self, test_client: TestClient) -> None:
+        """Test a single malformed JSON-RPC request gets a JSON-RPC error."""
+        response = test_client.post("/mcp/jsonrpc", json={"jsonrpc": "2.0", "id": 1})
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["id"] == 1
+        assert data["error"]["code"] == -32600
+
+    def test_jsonrpc_notification_gets_no_reply(self, test_client: TestClient) -> None:
+        """Test that a request without an id is not answered."""
+        response = test_client.post("/mcp/jsonrpc", json={"jsonrpc": "2.0", "method": "tools/list"})
+
+        assert response.status_code == 204
+        assert response.content == b""
+
+    def test_jsonrpc_batch_skips_notifications(self, test_client: TestClient) -> None:
+        """Test that batch notifications are left out of the replies."""
+        request = [
+            {"jsonrpc": "2.0", "method": "tools/list"},
+            {"jsonrpc": "2.0", "id": None, "method": "tools/list"},
+            {"jsonrpc": "2.0", "id": "batch-1", "method": "prompts/list"}
+        ]
+
+        response = test_client.post("/mcp/jsonrpc", json=request)
+
+        assert response.status_code == 200
+        assert [reply["id"] for reply in response.json()] == [None, "batch-1"]
+
+    def test_jsonrpc_batch_of_notifications(self, test_client: TestClient) -> None:
+        """Test that a batch of only notifications gets an empty response."""
+        request = [
+            {"jsonrpc": "2.0", "method": "tools/list"},
+            {"jsonrpc": "2.0", "method": "invalid/method"}
+        ]
+
+        response = test_client.post("/mcp/jsonrpc", json=request)
+
+        assert response.status_code == 204
+        assert response.content == b""
+
+    def test_jsonrpc_batch_too_large(self, test_client: TestClient) -> None:
+        """Test JSON-RPC batch larger than the configured limit."""
+        request = [
+            {"jsonrpc": "2.0", "id": i, "method": "tools/list"}
+            for i in range(get_settings().jsonrpc_max_batch_size + 1)
+        ]
+
+        response = test_client.post("/mcp/jsonrpc", json=request)
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["error"]["code"] == -32600
+
+    def test_jsonrpc_parse_error(self, test_client: TestClient) -> None:
+        """Test JSON-RPC endpoint with a malformed body."""
+        response = test_client.post(
+            "/mcp/jsonrpc",
+            content=b"{not json",
+            headers={"Content-Type": "application/json"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["error"]["code"] == -32700
+
 
 @pytest.mark.unit
 class TestMCPDataModels:
@@ -336,7 +467,7 @@ class TestMCPDataModels:
             "clientInfo": {"name": "test", "version": "1.0.0"}
         }
         
-        request = InitializeRequest(**valid_data)
+        request = InitializeRequest.model_validate(valid_data)
         assert request.protocolVersion == "2024-11-05"
     
     def test_tool_call_request_validation(self) -> None:
@@ -350,7 +481,7 @@ class TestMCPDataModels:
             }
         }
         
-        request = ToolCallRequest(**valid_data)
+        request = ToolCallRequest.model_validate(valid_data)
         assert request.name == "generate_natal_chart"
         assert "date_time" in request.arguments
     
@@ -358,7 +489,7 @@ class TestMCPDataModels:
         """Test ResourceReadRequest validation."""
         valid_data = {"uri": "astrological_objects"}
         
-        request = ResourceReadRequest(**valid_data)
+        request = ResourceReadRequest.model_validate(valid_data)
         assert request.uri == "astrological_objects"
     
     def test_prompt_get_request_validation(self) -> None:
@@ -368,6 +499,6 @@ class TestMCPDataModels:
             "arguments": {"chart_data": {}, "detail_level": "medium"}
         }
         
-        request = PromptGetRequest(**valid_data)
+        request = PromptGetRequest.model_validate(valid_data)
         assert request.name == "natal_chart_interpretation"
         assert "chart_data" in request.arguments
\ No newline at end of file